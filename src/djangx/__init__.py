@@ -1,15 +1,13 @@
-import builtins
 import importlib.util
 import pathlib
 import sys
+from functools import cached_property
 from os import environ
-from typing import Any, NoReturn, Optional, TypeAlias, cast
+from typing import Any, Callable, NamedTuple, NoReturn, Optional, TypeAlias, cast
 
 from christianwhocodes.utils.enums import ExitCode
-from christianwhocodes.utils.pyproject import PyProject
 from christianwhocodes.utils.stdout import Text, print
 from christianwhocodes.utils.types import TypeConverter
-from dotenv import dotenv_values
 
 PKG_PATH: pathlib.Path = pathlib.Path(__file__).resolve().parent
 
@@ -17,9 +15,47 @@ PKG_NAME: str = PKG_PATH.name  # djangx
 
 PKG_DISPLAY_NAME: str = PKG_NAME[:-1] + PKG_NAME[-1].upper()  # djangX
 
+PROJECT_PATH: pathlib.Path = pathlib.Path.cwd()  # the project base directory
+
 _ValueType: TypeAlias = str | bool | list[str] | pathlib.Path | int | None
 
 
+def _to_list_of_str(value: Any) -> list[str]:
+    """Convert a TOML list or a comma-separated string to a list of stripped strings."""
+    # TOML values are already lists, so strip them without the generic converter
+    if isinstance(value, list):
+        return [str(item).strip() for item in cast(list[Any], value)]
+    return TypeConverter.to_list_of_str(value, str.strip)
+
+
+# Type -> converter used by ConfField.convert_value
+_CONVERTERS: dict[type, Callable[[Any], _ValueType]] = {
+    str: str,
+    int: int,
+    list: _to_list_of_str,
+    bool: TypeConverter.to_bool,
+    pathlib.Path: TypeConverter.to_path,
+}
+
+# Type -> factory for the empty value of a missing field (other types default to None)
+_EMPTY_VALUE_FACTORIES: dict[type, Callable[[], _ValueType]] = {
+    str: str,
+    int: int,
+    list: list,
+}
+
+
+class EnvFieldSpec(NamedTuple):
+    """Metadata of a ConfField that reads from an environment variable."""
+
+    class_name: str
+    choices: Optional[list[str]]
+    env: str
+    toml: Optional[str]
+    default: _ValueType
+    type: type
+
+
 class ConfField:
     """
     Configuration field descriptor.
@@ -47,6 +83,7 @@ class ConfField:
         self.choices = choices
         self.env = env
         self.toml = toml
+        self.toml_path: tuple[str, ...] = tuple(toml.split(".")) if toml else ()
         self.default = default
         self.type = type
 
@@ -61,6 +98,7 @@ class ConfField:
         return {
             "env": self.env,
             "toml": self.toml,
+            "toml_path": self.toml_path,
             "default": self.default,
             "type": self.type,
         }
@@ -86,30 +124,14 @@ class ConfField:
             ValueError: If conversion fails
         """
         if value is None:
-            match target_type:
-                case builtins.str:
-                    return ""
-                case builtins.int:
-                    return 0
-                case builtins.list:
-                    return []
-                case _:
-                    return None
+            empty_factory = _EMPTY_VALUE_FACTORIES.get(target_type)
+            return empty_factory() if empty_factory is not None else None
 
         try:
-            match target_type:
-                case builtins.str:
-                    return str(value)
-                case builtins.int:
-                    return int(value)
-                case builtins.list:
-                    return TypeConverter.to_list_of_str(value, str.strip)
-                case builtins.bool:
-                    return TypeConverter.to_bool(value)
-                case pathlib.Path:
-                    return TypeConverter.to_path(value)
-                case _:
-                    raise ValueError(f"Unsupported target type or type not specified: {target_type}")
+            converter = _CONVERTERS.get(target_type)
+            if converter is None:
+                raise ValueError(f"Unsupported target type or type not specified: {target_type}")
+            return converter(value)
 
         except ValueError as e:
             field_info = f" for field '{field_name}'" if field_name else ""
@@ -134,15 +156,22 @@ class Conf:
     # Track all Conf subclasses
     _subclasses: list[type["Conf"]] = []
 
+    # Env-backed fields of all Conf subclasses, registered at class creation
+    _env_fields: list[EnvFieldSpec] = []
+
     # ============================================================================
     # Configuration Loading
     # ============================================================================
+    # Shared by all subclasses, so the project is validated once per process
     _toml_section: Optional[dict[str, Any]] = None
     _validated: bool = False
 
+    # Merged .env and environment variables, read once per process
+    _env_cache: Optional[dict[str, Any]] = None
+
     def __init__(self):
         """Initialize and validate project on first instantiation."""
-        if not self._validated:
+        if not Conf._validated:
             self._load_project()
 
     @classmethod
@@ -157,7 +186,9 @@ class Conf:
             FileNotFoundError: If pyproject.toml doesn't exist
             KeyError: If tool section or djangX section is missing
         """
-        pyproject_path = pathlib.Path.cwd() / "pyproject.toml"
+        from christianwhocodes.utils.pyproject import PyProject
+
+        pyproject_path = PROJECT_PATH / "pyproject.toml"
 
         if not pyproject_path.exists():
             raise FileNotFoundError(f"pyproject.toml not found at {pyproject_path}")
@@ -183,7 +214,7 @@ class Conf:
             FileNotFoundError: If app/urls.py doesn't exist
             ValueError: If urlpatterns variable doesn't exist in urls.py
         """
-        urls_py = pathlib.Path.cwd() / "app" / "urls.py"
+        urls_py = PROJECT_PATH / "app" / "urls.py"
 
         if not (urls_py.exists() and urls_py.is_file()):
             raise FileNotFoundError(f"'app/urls.py' not found at {urls_py}")
@@ -212,7 +243,7 @@ class Conf:
             cls._check_urls_py()
 
         except (FileNotFoundError, KeyError, ValueError) as e:
-            cls._validated = False
+            Conf._validated = False
             print(
                 f"Are you currently executing in a {PKG_DISPLAY_NAME} project base directory?\n"
                 f"If not, navigate to your project's root or create a new {PKG_DISPLAY_NAME} app to run the command.\n\n"
@@ -224,7 +255,7 @@ class Conf:
             )
 
         except Exception as e:
-            cls._validated = False
+            Conf._validated = False
             print(
                 f"Unexpected error during project validation:\n{e}",
                 Text.WARNING,
@@ -232,40 +263,40 @@ class Conf:
 
         else:
             # Success - store configuration
-            cls._validated = True
-            cls._toml_section = toml_section
+            Conf._validated = True
+            Conf._toml_section = toml_section
 
         finally:
-            if not cls._validated:
+            if not Conf._validated:
                 sys.exit(ExitCode.ERROR)
 
     @property
     def _env(self) -> dict[str, Any]:
         """Get combined .env and environment variables as a dictionary."""
-        if not self._validated:
-            self._load_project()
-        return {
-            **dotenv_values(pathlib.Path.cwd() / ".env"),
-            **environ,  # override loaded values with environment variables
-        }
+        if Conf._env_cache is None:
+            from dotenv import dotenv_values
+
+            Conf._env_cache = {
+                **dotenv_values(PROJECT_PATH / ".env"),
+                **environ,  # override loaded values with environment variables
+            }
+        return Conf._env_cache
 
     @property
     def _toml(self) -> dict[str, Any]:
         """Get TOML configuration section."""
-        if not self._validated:
-            self._load_project()
-        assert self._toml_section is not None
-        return self._toml_section
+        assert Conf._toml_section is not None
+        return Conf._toml_section
 
-    def _get_from_toml(self, key: Optional[str]) -> Any:
-        """Get value from TOML configuration."""
-        if key is None:
+    def _get_from_toml(self, path: tuple[str, ...]) -> Any:
+        """Get value from TOML configuration by its pre-split key path."""
+        if not path:
             return None
 
         current: Any = self._toml
-        for k in key.split("."):
+        for k in path:
             if isinstance(current, dict) and k in current:
-                current = cast(Any, current[k])
+                current = current[k]
             else:
                 return None
 
@@ -274,7 +305,7 @@ class Conf:
     def _fetch_value(
         self,
         env_key: Optional[str] = None,
-        toml_key: Optional[str] = None,
+        toml_path: tuple[str, ...] = (),
         default: _ValueType = None,
     ) -> Any:
         """
@@ -285,7 +316,7 @@ class Conf:
             return self._env[env_key]
 
         # Fall back to TOML config
-        toml_value = self._get_from_toml(toml_key)
+        toml_value = self._get_from_toml(toml_path)
         if toml_value is not None:
             return toml_value
 
@@ -298,7 +329,7 @@ class Conf:
 
     def __init_subclass__(cls) -> None:
         """
-        Automatically convert ConfField descriptors to properties
+        Automatically convert ConfField descriptors to cached properties
         when a subclass is created.
         """
         super().__init_subclass__()
@@ -306,10 +337,6 @@ class Conf:
         # Register this subclass
         Conf._subclasses.append(cls)
 
-        # Initialize _env_fields for this subclass
-        if not hasattr(cls, "_env_fields"):
-            cls._env_fields: list[dict[str, Any]] = []
-
         for attr_name, attr_value in list(vars(cls).items()):
             # Skip private attributes, methods, and special descriptors
             if (
@@ -325,50 +352,45 @@ class Conf:
 
             # Store field metadata if it has an env key
             if attr_value.env is not None:
-                cls._env_fields.append(
-                    {
-                        "class": cls.__name__,
-                        "choices": attr_value.choices,
-                        "env": attr_value.env,
-                        "toml": attr_value.toml,
-                        "default": attr_value.default,
-                        "type": attr_value.type,
-                    }
+                Conf._env_fields.append(
+                    EnvFieldSpec(
+                        class_name=cls.__name__,
+                        choices=attr_value.choices,
+                        env=attr_value.env,
+                        toml=attr_value.toml,
+                        default=attr_value.default,
+                        type=attr_value.type,
+                    )
                 )
 
             # Create property getter with captured config
             def make_getter(field_name: str, field_config: dict[str, Any]):
                 def getter(self: "Conf") -> Any:
                     raw_value = self._fetch_value(
-                        field_config["env"], field_config["toml"], field_config["default"]
+                        field_config["env"], field_config["toml_path"], field_config["default"]
                     )
                     return ConfField.convert_value(raw_value, field_config["type"], field_name)
 
                 return getter
 
-            setattr(
-                cls,
-                attr_name,
-                property(make_getter(attr_name, attr_value.as_dict)),
-            )
+            # Cache the resolved value on the instance after the first read
+            field_property = cached_property(make_getter(attr_name, attr_value.as_dict))
+            field_property.__set_name__(cls, attr_name)
+            setattr(cls, attr_name, field_property)
 
     # ============================================================================
     # Metadata
     # ============================================================================
 
     @classmethod
-    def get_env_fields(cls) -> list[dict[str, Any]]:
+    def get_env_fields(cls) -> list[EnvFieldSpec]:
         """
         Collect all ConfField definitions that use environment variables
         from all Conf subclasses.
 
+        Fields are registered when each subclass is created, so this is a plain lookup.
+
         Returns:
-            List of dicts containing class, env key, toml key, choices key, default key and type key for each field
+            List of EnvFieldSpec records with the class name, choices, env key, toml key, default and type of each field
         """
-        env_fields: list[dict[str, Any]] = []
-
-        for subclass in cls._subclasses:
-            if hasattr(subclass, "_env_fields"):
-                env_fields.extend(subclass._env_fields)
-
-        return env_fields
+        return Conf._env_fields
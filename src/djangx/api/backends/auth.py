@@ -26,16 +26,22 @@ class UsernameOrEmailBackend(ModelBackend):
 
         User = get_user_model()
 
-        try:
-            # Query the user model with either username or email
-            user = User.objects.get(Q(username__iexact=username) | Q(email__iexact=username))
+        # Emails always contain "@", so a bare name only needs the username lookup.
+        # Usernames may also contain "@", so keep both lookups in that case.
+        if "@" in username:
+            lookup = Q(username__iexact=username) | Q(email__iexact=username)
+        else:
+            lookup = Q(username__iexact=username)
 
-            # Check the password and return user if valid
-            if user.check_password(password):
-                return user
+        try:
+            user = User.objects.get(lookup)
+        except (User.DoesNotExist, User.MultipleObjectsReturned):
+            # Ambiguous credentials must not pick an account; run the default
+            # password hasher either way to mitigate timing attacks
+            User().set_password(password)
             return None
 
-        except User.DoesNotExist:
-            # Run the default password hasher to mitigate timing attacks
-            User().set_password(User.objects.make_random_password())
-            return None
+        # Check the password and return user if valid
+        if user.check_password(password):
+            return user
+        return None
@@ -53,24 +53,20 @@ def _get_databases_config() -> DatabasesDict:
                 "sslmode": _DATABASE.ssl_mode,
             }
 
-            # Add service or connection vars
+            config: DatabaseDict = {
+                "ENGINE": "django.db.backends.postgresql",
+                "NAME": _DATABASE.name,
+                "OPTIONS": options,
+            }
+
+            # Add connection vars or service
             if _DATABASE.use_vars:
-                config: DatabaseDict = {
-                    "ENGINE": "django.db.backends.postgresql",
-                    "NAME": _DATABASE.name,
-                    "USER": _DATABASE.user,
-                    "PASSWORD": _DATABASE.password,
-                    "HOST": _DATABASE.host,
-                    "PORT": _DATABASE.port,
-                    "OPTIONS": options,
-                }
+                config["USER"] = _DATABASE.user
+                config["PASSWORD"] = _DATABASE.password
+                config["HOST"] = _DATABASE.host
+                config["PORT"] = _DATABASE.port
             else:
                 options["service"] = _DATABASE.service
-                config = {
-                    "ENGINE": "django.db.backends.postgresql",
-                    "NAME": _DATABASE.name,
-                    "OPTIONS": options,
-                }
 
             return {"default": config}
         case _:
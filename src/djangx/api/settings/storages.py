@@ -28,19 +28,28 @@ class StorageConf(Conf):
 _STORAGE = StorageConf()
 
 
+_FILESYSTEM_STORAGE = "django.core.files.storage.FileSystemStorage"
+_VERCEL_BLOB_STORAGE = f"{PKG_NAME}.api.backends.storages.VercelBlobStorage"
+
+# Backend names and their aliases, resolved with a single lookup
+_STORAGE_BACKENDS: dict[str, str] = {
+    "filesystem": _FILESYSTEM_STORAGE,
+    "local": _FILESYSTEM_STORAGE,
+    "fs": _FILESYSTEM_STORAGE,
+    "blob": _VERCEL_BLOB_STORAGE,
+    "vercel": _VERCEL_BLOB_STORAGE,
+    "vercel-blob": _VERCEL_BLOB_STORAGE,
+}
+
+
 def _get_storages_config() -> StoragesDict:
     """Generate storage configuration based on backend type."""
 
     backend: str = _STORAGE.backend
-    storage_backend: str
-
-    match backend:
-        case "filesystem" | "local" | "fs":
-            storage_backend = "django.core.files.storage.FileSystemStorage"
-        case "blob" | "vercel" | "vercel-blob":
-            storage_backend = f"{PKG_NAME}.api.backends.storages.VercelBlobStorage"
-        case _:
-            raise ValueError(f"Unsupported storage backend: {backend}")
+    storage_backend = _STORAGE_BACKENDS.get(backend)
+
+    if storage_backend is None:
+        raise ValueError(f"Unsupported storage backend: {backend}")
 
     return {
         "staticfiles": {
@@ -5,27 +5,30 @@ from typing import NoReturn
 
 from .. import PKG_NAME
 
+_VERSION_ARGS = frozenset({"-v", "--version", "version"})
+
 
 def main() -> NoReturn | None:
     """Main entry point for the CLI."""
-    match sys.argv[1]:
-        case "-v" | "--version" | "version":
-            from christianwhocodes.utils.version import print_version
+    args = sys.argv[1:2]
+
+    if args and args[0] in _VERSION_ARGS:
+        from christianwhocodes.utils.version import print_version
 
-            sys.exit(print_version(PKG_NAME))
+        sys.exit(print_version(PKG_NAME))
 
-        case _:
-            from os import environ
-            from pathlib import Path
+    else:
+        from os import environ
+        from pathlib import Path
 
-            from django.core.management import ManagementUtility
+        from django.core.management import ManagementUtility
 
-            sys.path.insert(0, str(Path.cwd()))
-            environ.setdefault("DJANGO_SETTINGS_MODULE", f"{PKG_NAME}.settings")
+        sys.path.insert(0, str(Path.cwd()))
+        environ.setdefault("DJANGO_SETTINGS_MODULE", f"{PKG_NAME}.settings")
 
-            utility = ManagementUtility(sys.argv)
-            utility.prog_name = PKG_NAME
-            utility.execute()
+        utility = ManagementUtility(sys.argv)
+        utility.prog_name = PKG_NAME
+        utility.execute()
 
 
 if __name__ == "__main__":
@@ -22,17 +22,13 @@ class Command(CollectstaticCommand):
 
         # Get the source CSS path
         source_css: Path = tailwind_conf.source
-        source_css_dir = source_css.parent
+        dir_parts = source_css.parts[:-1]
 
-        # Traverse up to find the 'static' directory
-        while source_css_dir.name != "static" and source_css_dir != source_css_dir.parent:
-            source_css_dir = source_css_dir.parent
-
-        # Build the relative path from the static directory
-        if source_css_dir.name == "static":
+        # Find the nearest 'static' directory above the source file
+        if "static" in dir_parts:
             # Get the relative path from static directory to the source file
-            relative_path = source_css.relative_to(source_css_dir)
-            ignore_pattern = str(relative_path)
+            static_index = len(dir_parts) - 1 - dir_parts[::-1].index("static")
+            ignore_pattern = str(Path(*source_css.parts[static_index + 1 :]))
         else:
             # Fallback: just ignore the filename
             ignore_pattern = source_css.name
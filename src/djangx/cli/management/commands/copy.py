@@ -185,11 +185,15 @@ class DirectoryCopier(Copier):
 
         Returns:
             True if the user enters 'y' or 'Y', False otherwise (defaults to no).
+            Closed input (EOF) takes the default instead of raising.
         """
         prompt: str = (
             f"\n{self.command.style.WARNING(str(destination))} already exists. Overwrite? [y/N]: "
         )
-        response: str = input(prompt).strip().lower()
+        try:
+            response: str = input(prompt).strip().lower()
+        except EOFError:
+            return False
         return response == "y"
 
 
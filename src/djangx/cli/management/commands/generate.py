@@ -1,7 +1,10 @@
-import builtins
+import json
 import pathlib
+from collections import defaultdict
 from enum import StrEnum
-from typing import Any, Optional, Type, cast
+from functools import cache
+from io import StringIO
+from typing import Any, Callable, ClassVar, Optional, Type, cast
 
 from christianwhocodes.generators.file import (
     FileGenerator,
@@ -12,7 +15,7 @@ from christianwhocodes.generators.file import (
 )
 from django.core.management.base import BaseCommand, CommandParser
 
-from .... import PKG_DISPLAY_NAME, PKG_NAME, Conf
+from .... import PKG_DISPLAY_NAME, PKG_NAME, Conf, EnvFieldSpec
 from ....settings import FILE_GENERATOR_PATHS, RUNCOMMANDS
 
 
@@ -25,15 +28,104 @@ class FileOption(StrEnum):
     VERCEL = "vercel"
 
 
+_FILE_OPTION_VALUES: tuple[str, ...] = tuple(opt.value for opt in FileOption)
+_FILE_OPTION_CHOICES_HELP: str = ", ".join(_FILE_OPTION_VALUES)
+
+_EQ_RULE = "# " + "=" * 78 + "\n"
+_DASH_RULE = "# " + "-" * 78 + "\n"
+_ENV_FILE_FOOTER = f"{_EQ_RULE}# End of Configuration\n{_EQ_RULE.rstrip()}"
+
+_TYPE_EXAMPLES: dict[type, str] = {
+    bool: '"true" | "false"',
+    int: '"123"',
+    float: '"123.45"',
+    list: '"value1,value2,value3"',
+    pathlib.Path: '"/full/path/to/something"',
+}
+_DEFAULT_TYPE_EXAMPLE = '"value"'
+
+
+@cache
+def _format_choices(choices: tuple[str, ...]) -> str:
+    """Format choices as 'choice1' | 'choice2' | 'choice3'."""
+    return " | ".join(f'"{choice}"' for choice in choices)
+
+
+def _format_variable_hint(env_var: str, choices: Optional[list[str]], field_type: type) -> str:
+    """Format variable hint showing proper syntax based on type."""
+    if choices:
+        return f"{env_var}={_format_choices(tuple(choices))}"
+    else:
+        return f"{env_var}={_TYPE_EXAMPLES.get(field_type, _DEFAULT_TYPE_EXAMPLE)}"
+
+
+def _format_bool_default(value: Any) -> str:
+    """Format a bool default for display in comments."""
+    return "true" if value else "false"
+
+
+def _format_list_default(value: Any) -> str:
+    """Format a list default for display in comments."""
+    if isinstance(value, list):
+        list_items = cast(list[Any], value)
+        if not list_items:
+            return "(empty list)"
+        return ",".join(str(v) for v in list_items)
+    return str(value)
+
+
+@cache
+def _format_path_default(value: Any) -> str:
+    """Format a path default for display in comments."""
+    return str(pathlib.PurePosixPath(value))
+
+
+def _format_quoted(value: Any) -> str:
+    """Format a value as a quoted environment variable assignment."""
+    return f'"{str(value)}"'
+
+
+def _format_bool_env(value: Any) -> str:
+    """Format a bool value for environment variable assignment."""
+    return '"true"' if value else '"false"'
+
+
+def _format_list_env(value: Any) -> str:
+    """Format a list value for environment variable assignment."""
+    if isinstance(value, list):
+        list_items = cast(list[Any], value)
+        if not list_items:
+            return '""'
+        return f'"{",".join(str(v) for v in list_items)}"'
+    return f'"{value}"'
+
+
+def _format_path_env(value: Any) -> str:
+    """Format a path value for environment variable assignment."""
+    return f'"{_format_path_default(value)}"'
+
+
 class EnvFileGenerator(FileGenerator):
-    f"""
+    """
     Generator for environment configuration file (.env.example).
 
-    Creates a .env.example file in the {PKG_DISPLAY_NAME} project base directory with all
+    Creates a .env.example file in the djangX project base directory with all
     possible environment variables from configuration classes.
     All variables are commented out by default.
     """
 
+    # Per-type formatting, looked up once per field instead of matched case by case
+    _DEFAULT_FORMATTERS: ClassVar[dict[type, Callable[[Any], str]]] = {
+        bool: _format_bool_default,
+        list: _format_list_default,
+        pathlib.Path: _format_path_default,
+    }
+    _ENV_FORMATTERS: ClassVar[dict[type, Callable[[Any], str]]] = {
+        bool: _format_bool_env,
+        list: _format_list_env,
+        pathlib.Path: _format_path_env,
+    }
+
     @property
     def file_path(self) -> pathlib.Path:
         """Return the path for the .env.example file."""
@@ -44,168 +136,107 @@ class EnvFileGenerator(FileGenerator):
     def data(self) -> str:
         """Generate .env file content based on all ConfFields from Conf subclasses."""
 
-        lines: list[str] = []
+        buf = StringIO()
 
         # Add header
-        lines.extend(self._add_header())
+        self._add_header(buf)
 
         # Get all fields from Conf subclasses
         env_fields = Conf.get_env_fields()
 
         # Group fields by class
-        fields_by_class: dict[str, list[dict[str, Any]]] = {}
+        fields_by_class: defaultdict[str, list[EnvFieldSpec]] = defaultdict(list)
         for field in env_fields:
-            class_name = cast(str, field["class"])
-            if class_name not in fields_by_class:
-                fields_by_class[class_name] = []
-            fields_by_class[class_name].append(field)
+            fields_by_class[field.class_name].append(field)
 
         # Generate content for each class group
-        for class_name in sorted(fields_by_class.keys()):
-            fields = fields_by_class[class_name]
-
+        for class_name, fields in sorted(fields_by_class.items()):
             # Add section header
-            lines.extend(self._add_section_header(class_name))
+            self._add_section_header(buf, class_name)
 
             # Process each field in this class
             for field in fields:
-                env_var = field["env"]
-                toml_key = field["toml"]
-                choices_key = field["choices"]
-                default_value = field["default"]
-                field_type = field["type"]
+                env_var = field.env
+                default_value = field.default
+                field_type = field.type
 
                 # Add field documentation with proper format hints
-                lines.append(
-                    f"# Variable: {self._format_variable_hint(env_var, choices_key, field_type)}"
-                )
-                if toml_key:
-                    lines.append(f"# TOML Key: {toml_key}")
+                hint = _format_variable_hint(env_var, field.choices, field_type)
+                toml_line = f"# TOML Key: {field.toml}\n" if field.toml else ""
 
                 # Format default value for display
-                if default_value is not None:
-                    formatted_default = self._format_default_value(default_value, field_type)
-                    lines.append(f"# Default: {formatted_default}")
-                else:
-                    lines.append("# Default: (none)")
+                formatted_default = self._format_default_value(default_value, field_type)
 
                 # Add the actual environment variable line (commented out)
                 if default_value is not None and default_value != "" and default_value != []:
                     formatted_value = self._format_env_value(default_value, field_type)
-                    lines.append(f"{env_var}={formatted_value}")
+                    assignment = f"{env_var}={formatted_value}"
                 else:
-                    lines.append(f"# {env_var}=")
+                    assignment = f"# {env_var}="
 
-                lines.append("")
+                # Write the whole field block at once
+                buf.write(
+                    f"# Variable: {hint}\n{toml_line}# Default: {formatted_default}\n{assignment}\n\n"
+                )
 
-            lines.append("")
+            buf.write("\n")
 
         # Add footer
-        lines.append("# " + "=" * 78)
-        lines.append("# End of Configuration")
-        lines.append("# " + "=" * 78)
-
-        return "\n".join(lines)
-
-    def _add_header(self) -> list[str]:
-        """Add header to the .env.example file."""
-        lines: list[str] = []
-        lines.append("# " + "=" * 78)
-        lines.append(f"# {PKG_DISPLAY_NAME} Environment Configuration")
-        lines.append("# " + "=" * 78)
-        lines.append("#")
-        lines.append("# This file contains all available environment variables for configuration.")
-        lines.append("#")
-        lines.append("# Configuration Priority: ENV > TOML > Default")
-        lines.append("# " + "=" * 78)
-        lines.append("")
-        return lines
-
-    def _add_section_header(self, class_name: str) -> list[str]:
-        """Add section header for a configuration class."""
-        lines: list[str] = []
-        lines.append("# " + "-" * 78)
-        lines.append(f"# {class_name} Configuration")
-        lines.append("# " + "-" * 78)
-        lines.append("")
-        return lines
-
-    def _format_choices(self, choices: list[str]) -> str:
-        """Format choices as 'choice1' | 'choice2' | 'choice3'."""
-        return " | ".join(f'"{choice}"' for choice in choices)
-
-    def _get_type_example(self, field_type: type) -> str:
-        """Get example value for a field type."""
-        match field_type:
-            case builtins.bool:
-                return '"true" | "false"'
-            case builtins.int:
-                return '"123"'
-            case builtins.float:
-                return '"123.45"'
-            case builtins.list:
-                return '"value1,value2,value3"'
-            case pathlib.Path:
-                return '"/full/path/to/something"'
-            case _:
-                return '"value"'
-
-    def _format_variable_hint(
-        self, env_var: str, choices_key: Optional[list[str]], field_type: type
-    ) -> str:
-        """Format variable hint showing proper syntax based on type."""
-        if choices_key:
-            return f"{env_var}={self._format_choices(choices_key)}"
-        else:
-            return f"{env_var}={self._get_type_example(field_type)}"
+        buf.write(_ENV_FILE_FOOTER)
+
+        return buf.getvalue()
+
+    def _add_header(self, buf: StringIO) -> None:
+        """Write the header of the .env.example file."""
+        buf.write(_EQ_RULE)
+        buf.write(f"# {PKG_DISPLAY_NAME} Environment Configuration\n")
+        buf.write(_EQ_RULE)
+        buf.write("#\n")
+        buf.write("# This file contains all available environment variables for configuration.\n")
+        buf.write("#\n")
+        buf.write("# Configuration Priority: ENV > TOML > Default\n")
+        buf.write(_EQ_RULE)
+        buf.write("\n")
+
+    def _add_section_header(self, buf: StringIO, class_name: str) -> None:
+        """Write the section header for a configuration class."""
+        buf.write(_DASH_RULE)
+        buf.write(f"# {class_name} Configuration\n")
+        buf.write(_DASH_RULE)
+        buf.write("\n")
 
     def _format_default_value(self, value: Any, field_type: type) -> str:
         """Format default value for display in comments."""
         if value is None:
             return "(none)"
 
-        match field_type:
-            case builtins.bool:
-                return "true" if value else "false"
-            case builtins.list:
-                if isinstance(value, list):
-                    list_items = cast(list[Any], value)
-                    if not list_items:
-                        return "(empty list)"
-                    return ",".join(str(v) for v in list_items)
-                return str(value)
-            case pathlib.Path:
-                return str(pathlib.PurePosixPath(value))
-            case _:
-                return str(value)
+        # Most fields are plain strings, which need no formatter lookup
+        if field_type is str:
+            return str(value)
+
+        return self._DEFAULT_FORMATTERS.get(field_type, str)(value)
 
     def _format_env_value(self, value: Any, field_type: type) -> str:
         """Format value for environment variable assignment."""
         if value is None or value == "":
             return '""'
 
-        match field_type:
-            case builtins.bool:
-                return '"true"' if value else '"false"'
-            case builtins.list:
-                if isinstance(value, list):
-                    list_items = cast(list[Any], value)
-                    if not list_items:
-                        return '""'
-                    return f'"{",".join(str(v) for v in list_items)}"'
-                return f'"{value}"'
-            case pathlib.Path:
-                return f'"{str(pathlib.PurePosixPath(value))}"'
-            case _:
-                return f'"{str(value)}"'
+        # Most fields are plain strings, which need no formatter lookup
+        if field_type is str:
+            return f'"{value}"'
+
+        return self._ENV_FORMATTERS.get(field_type, _format_quoted)(value)
+
+
+_API_MAIN_PY: str = f"from {PKG_NAME}.api.backends.gateway import application\n\napp = application\n"
 
 
 class APIFileGenerator(FileGenerator):
-    f"""
+    """
     Generator for ASGI / WSGI configuration in api/main.py file.
-    
+
     Creates an main.py file in the /api directory.
-    Required for running {PKG_DISPLAY_NAME} apps with ASGI or WSGI servers.
+    Required for running djangX apps with ASGI or WSGI servers.
     Note that the type of api gateway dependes on the USE_ASGI setting.
     """
 
@@ -217,14 +248,35 @@ class APIFileGenerator(FileGenerator):
     @property
     def data(self) -> str:
         """Return template content for api/main.py."""
-        return f"from {PKG_NAME}.api.backends.gateway import application\n\napp = application\n"
+        return _API_MAIN_PY
+
+
+def _build_vercel_json() -> str:
+    """Serialize the vercel.json content for the configured run commands."""
+    content: dict[str, Any] = {"$schema": "https://openapi.vercel.sh/vercel.json"}
+
+    # Add installCommand only if RUNCOMMANDS.install is non-empty
+    if RUNCOMMANDS.install:
+        content["installCommand"] = f"uv run {PKG_NAME} runinstall"
+
+    # Add buildCommand only if RUNCOMMANDS.build is non-empty
+    if RUNCOMMANDS.build:
+        content["buildCommand"] = f"uv run {PKG_NAME} runbuild"
+
+    content["rewrites"] = [{"source": "/(.*)", "destination": "/api/main"}]
+
+    return json.dumps(content, indent=2) + "\n"
+
+
+# Run commands are fixed for the process, so vercel.json is serialized once
+_VERCEL_JSON: str = _build_vercel_json()
 
 
 class VercelFileGenerator(FileGenerator):
-    f"""
+    """
     Generator for Vercel configuration file (vercel.json).
 
-    Creates a vercel.json file in the {PKG_DISPLAY_NAME} project base directory.
+    Creates a vercel.json file in the djangX project base directory.
     Useful for deploying to Vercel with custom install/build commands.
     """
 
@@ -237,46 +289,30 @@ class VercelFileGenerator(FileGenerator):
     @property
     def data(self) -> str:
         """Return template content for vercel.json."""
-        lines = [
-            "{",
-            '  "$schema": "https://openapi.vercel.sh/vercel.json",',
-        ]
-
-        # Add installCommand only if RUNCOMMANDS.install is non-empty
-        if RUNCOMMANDS.install:
-            lines.append(f'  "installCommand": "uv run {PKG_NAME} runinstall",')
-
-        # Add buildCommand only if RUNCOMMANDS.build is non-empty
-        if RUNCOMMANDS.build:
-            lines.append(f'  "buildCommand": "uv run {PKG_NAME} runbuild",')
-
-        lines.extend(
-            [
-                '  "rewrites": [',
-                "    {",
-                '      "source": "/(.*)",',
-                '      "destination": "/api/main"',
-                "    }",
-                "  ]",
-                "}",
-            ]
-        )
-
-        return "\n".join(lines) + "\n"
+        return _VERCEL_JSON
 
 
 class Command(BaseCommand):
     help: str = "Generate configuration files (e.g., .env.example, vercel.json, asgi.py, wsgi.py, .pg_service.conf, pgpass.conf / .pgpass, ssh config)."
 
+    generators: ClassVar[dict[FileOption, Type[FileGenerator]]] = {
+        FileOption.VERCEL: VercelFileGenerator,
+        FileOption.API: APIFileGenerator,
+        FileOption.PG_SERVICE: PgServiceFileGenerator,
+        FileOption.PGPASS: PgPassFileGenerator,
+        FileOption.SSH_CONFIG: SSHConfigFileGenerator,
+        FileOption.ENV: EnvFileGenerator,
+    }
+
     def add_arguments(self, parser: CommandParser) -> None:
         parser.add_argument(
             "-f",
             "--file",
             dest="file",
-            choices=[opt.value for opt in FileOption],
+            choices=_FILE_OPTION_VALUES,
             type=FileOption,
             required=True,
-            help=f"Specify which file to generate (options: {', '.join(o.value for o in FileOption)}).",
+            help=f"Specify which file to generate (options: {_FILE_OPTION_CHOICES_HELP}).",
         )
         parser.add_argument(
             "-y",
@@ -287,18 +323,9 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args: Any, **options: Any) -> None:
-        file_option: FileOption = FileOption(options["file"])
+        file_option: FileOption = options["file"]
         force: bool = options["force"]
 
-        generators: dict[FileOption, Type[FileGenerator]] = {
-            FileOption.VERCEL: VercelFileGenerator,
-            FileOption.API: APIFileGenerator,
-            FileOption.PG_SERVICE: PgServiceFileGenerator,
-            FileOption.PGPASS: PgPassFileGenerator,
-            FileOption.SSH_CONFIG: SSHConfigFileGenerator,
-            FileOption.ENV: EnvFileGenerator,
-        }
-
-        generator_class: Type[FileGenerator] = generators[file_option]
+        generator_class: Type[FileGenerator] = self.generators[file_option]
         generator = generator_class()
         generator.create(force=force)
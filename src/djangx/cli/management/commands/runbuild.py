@@ -22,6 +22,11 @@ class BuildCommandGenerator(CommandGenerator):
         runcommands_conf = RUNCOMMANDS
         return runcommands_conf.build
 
+    def get_parallel_commands(self) -> list[str]:
+        """Retrieve build command names that may run concurrently."""
+        runcommands_conf = RUNCOMMANDS
+        return runcommands_conf.build_parallel
+
     def create_output_handler(self) -> CommandOutput:
         """Create the output handler for build commands."""
         return Output(self.django_command, ArtType.BUILD)
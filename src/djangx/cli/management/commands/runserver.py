@@ -1,20 +1,40 @@
-from socket import gaierror, gethostbyname, gethostname
+from datetime import datetime
+from functools import cache
+from socket import AF_INET, SOCK_DGRAM, socket
 from threading import Thread
-from typing import Any
+from typing import Any, Callable
 
 from christianwhocodes.utils.version import Version
 from django.contrib.staticfiles.management.commands.runserver import (
     Command as RunserverCommand,
 )
 from django.core.management.base import CommandParser
-from django.utils import timezone
-from pyperclip import copy
+from django.utils.timezone import get_current_timezone
 
 from .... import PKG_DISPLAY_NAME, PKG_NAME
 from ..helpers.art import ArtPrinter
 from ..helpers.run import CommandExecutor
 
 
+# Seconds to wait for the LAN address and clipboard copy before writing the banner
+_NETWORK_INFO_TIMEOUT = 1.0
+
+
+@cache
+def _get_pyperclip_copy() -> Callable[[str], None] | None:
+    """Import pyperclip's copy function once.
+
+    Returns:
+        The copy function, or None if pyperclip is not installed.
+    """
+    try:
+        from pyperclip import copy
+    except ImportError:
+        return None
+
+    return copy
+
+
 class Command(RunserverCommand):
     help = "Development server"
 
@@ -27,10 +47,14 @@ class Command(RunserverCommand):
     no_clipboard: bool
     no_tailwind_watch: bool
     _watcher_thread: Thread | None
+    _lan_ip: str | None
+    _clipboard_status: str | None
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._watcher_thread = None
+        self._lan_ip = None
+        self._clipboard_status = None
 
     def add_arguments(self, parser: CommandParser) -> None:
         """Add custom arguments to the command.
@@ -77,9 +101,9 @@ class Command(RunserverCommand):
         return super().inner_run(*args, **options)  # type: ignore
 
     def check_migrations(self) -> None:
-        f"""Check for unapplied migrations and display a warning.
+        """Check for unapplied migrations and display a warning.
 
-        Overrides Django's default check_migrations to use '{PKG_NAME} migrate'
+        Overrides Django's default check_migrations to use 'djangx migrate'
         instead of 'python manage.py migrate' in the warning message.
 
         Prints a notice if there are unapplied migrations that could affect
@@ -120,6 +144,7 @@ class Command(RunserverCommand):
         banner, server information, and clipboard functionality.
         Called when the development server binds to a port. Displays startup
         banner, server information, and optionally copies the URL to clipboard.
+        The banner and server information are written in a single call.
 
         Args:
             server_port: The port the server is bound to.
@@ -127,13 +152,30 @@ class Command(RunserverCommand):
         self._print_startup_message()
         if not self.no_tailwind_watch:
             self._start_tailwind_watcher()
-        self._print_startup_banner()
-        self._print_server_info(server_port)
 
-        if not self.no_clipboard:
-            self._copy_to_clipboard(server_port)
+        # Resolve the LAN address and copy to the clipboard (which may spawn
+        # xclip/xsel/wl-copy) while the banner is being rendered.
+        network_thread = Thread(
+            target=self._prepare_network_info,
+            args=(server_port,),
+            daemon=True,
+            name="NetworkInfo",
+        )
+        network_thread.start()
 
-        self.stdout.write("")  # spacing
+        lines: list[str] = []
+        self._add_startup_banner(lines)
+        self._add_server_info(lines, server_port)
+
+        # Don't let a slow lookup or clipboard tool hold up the banner
+        network_thread.join(timeout=_NETWORK_INFO_TIMEOUT)
+        self._add_network_info(lines, server_port)
+        if network_thread.is_alive():
+            # Whatever resolved in time is shown above; say so instead of silently dropping the rest
+            lines.append(f"  ⏳ {self.style.WARNING('Network info timed out - skipped')}")
+
+        lines.append("")  # spacing
+        self.stdout.write("\n".join(lines) + "\n")
 
     def _build_tailwind_initial(self) -> None:
         """Build Tailwind CSS once before starting the server.
@@ -176,60 +218,61 @@ class Command(RunserverCommand):
         """Print initial startup message."""
         self.stdout.write(self.style.SUCCESS("\n✨ Starting dev server...") + "\n")
 
-    def _print_startup_banner(self) -> None:
-        """Print ASCII banner based on terminal width.
+    def _add_startup_banner(self, lines: list[str]) -> None:
+        """Add ASCII banner based on terminal width.
 
-        Displays either a full ASCII art banner or a compact version depending
+        Adds either a full ASCII art banner or a compact version depending
         on whether the terminal is wide enough. Includes warning messages and
         control instructions appropriate for the terminal size.
+
+        Args:
+            lines: Output lines to append to.
         """
         printer = ArtPrinter(self)
-        printer.print_dev_banner()
+        lines.extend(printer.get_dev_banner_lines())
 
-    def _print_server_info(self, server_port: int) -> None:
-        """Print server and version information.
+    def _add_server_info(self, lines: list[str], server_port: int) -> None:
+        """Add server and version information.
 
-        Displays the current date/time with timezone, version,
-        local server address, and network address (if applicable).
+        Adds the current date/time with timezone, version
+        and local server address.
 
         Args:
+            lines: Output lines to append to.
             server_port: The port the server is bound to.
         """
-        self._print_timestamp()
-        self._print_version()
-        self._print_local_url(server_port)
+        self._add_timestamp(lines)
+        self._add_version(lines)
+        self._add_local_url(lines, server_port)
 
-        if self.addr in ("0", "0.0.0.0"):
-            self._print_network_url(server_port)
-
-    def _print_timestamp(self) -> None:
-        """Print current date and time with timezone."""
-        tz = timezone.get_current_timezone()
-        now = timezone.localtime(timezone.now(), timezone=tz)
+    def _add_timestamp(self, lines: list[str]) -> None:
+        """Add current date and time with timezone."""
+        now = datetime.now(get_current_timezone())
         timestamp = now.strftime("%B %d, %Y - %X")
         tz_name = now.strftime("%Z")
 
         if tz_name:
-            self.stdout.write(f"\n  📅 Date: {self.style.HTTP_NOT_MODIFIED(timestamp)} ({tz_name})")
+            lines.append(f"\n  📅 Date: {self.style.HTTP_NOT_MODIFIED(timestamp)} ({tz_name})")
         else:
-            self.stdout.write(f"\n  📅 Date: {self.style.HTTP_NOT_MODIFIED(timestamp)}")
+            lines.append(f"\n  📅 Date: {self.style.HTTP_NOT_MODIFIED(timestamp)}")
 
-    def _print_version(self) -> None:
-        """Print version."""
+    def _add_version(self, lines: list[str]) -> None:
+        """Add version."""
 
-        self.stdout.write(
+        lines.append(
             f"  🔧 {PKG_DISPLAY_NAME} version: {self.style.HTTP_NOT_MODIFIED(Version.get(PKG_NAME)[0])}"
         )
 
-    def _print_local_url(self, server_port: int) -> None:
-        """Print local server URL.
+    def _add_local_url(self, lines: list[str], server_port: int) -> None:
+        """Add local server URL.
 
         Args:
+            lines: Output lines to append to.
             server_port: The port the server is bound to.
         """
         addr = self._format_address()
         url = f"{self.protocol}://{addr}:{server_port}/"
-        self.stdout.write(f"  🌐 Local address:   {self.style.SUCCESS(url)}")
+        lines.append(f"  🌐 Local address:   {self.style.SUCCESS(url)}")
 
     def _format_address(self) -> str:
         """Format address for display.
@@ -247,25 +290,55 @@ class Command(RunserverCommand):
         else:
             return self.addr
 
-    def _print_network_url(self, server_port: int) -> None:
-        """Print LAN IP address if available.
+    def _prepare_network_info(self, server_port: int) -> None:
+        """Resolve the LAN IP address and copy the server URL to clipboard.
+
+        Runs in a background thread while the banner is rendered. Results are
+        stored on the command and added to the output by _add_network_info.
+
+        Args:
+            server_port: The port the server is bound to.
+        """
+        if self.addr in ("0", "0.0.0.0"):
+            self._lan_ip = self._resolve_lan_ip()
 
-        Attempts to determine the local network IP address and displays
-        the network URL for accessing the dev server from other machines
-        on the same network. Silently fails if the address cannot be determined.
+        if not self.no_clipboard:
+            self._clipboard_status = self._copy_to_clipboard(server_port)
+
+    def _add_network_info(self, lines: list[str], server_port: int) -> None:
+        """Add the network address and clipboard status, if available.
 
         Args:
+            lines: Output lines to append to.
             server_port: The port the server is bound to.
         """
+        if self._lan_ip:
+            network_url = f"{self.protocol}://{self._lan_ip}:{server_port}/"
+            lines.append(f"  🌍 Network address: {self.style.SUCCESS(network_url)}")
+
+        if self._clipboard_status:
+            lines.append(self._clipboard_status)
+
+    def _resolve_lan_ip(self) -> str | None:
+        """Determine the LAN IP address.
+
+        Attempts to determine the local network IP address used for accessing
+        the dev server from other machines on the same network.
+
+        Returns:
+            The LAN IP address, or None if it cannot be determined.
+        """
         try:
-            hostname = gethostname()
-            local_ip = gethostbyname(hostname)
-            network_url = f"{self.protocol}://{local_ip}:{server_port}/"
-            self.stdout.write(f"  🌍 Network address: {self.style.SUCCESS(network_url)}")
-        except gaierror:
-            pass
-
-    def _copy_to_clipboard(self, server_port: int) -> None:
+            # Connecting a UDP socket sends no packets; it only asks the kernel which
+            # interface would route to the address, so no DNS lookup can block startup.
+            with socket(AF_INET, SOCK_DGRAM) as sock:
+                sock.settimeout(0.1)
+                sock.connect(("10.255.255.255", 1))
+                return sock.getsockname()[0]
+        except OSError:
+            return None
+
+    def _copy_to_clipboard(self, server_port: int) -> str | None:
         """Copy server URL to clipboard.
 
         Attempts to copy the server URL to the system clipboard using pyperclip.
@@ -273,16 +346,19 @@ class Command(RunserverCommand):
 
         Args:
             server_port: The port the server is bound to.
+
+        Returns:
+            The status line to display, or None if the copy failed silently.
         """
+        copy = _get_pyperclip_copy()
+        if copy is None:
+            return f"  📋 {self.style.WARNING('pyperclip not installed - skipping clipboard copy')}"
+
         try:
             addr = self._format_address()
             url = f"{self.protocol}://{addr}:{server_port}/"
 
             copy(url)
-            self.stdout.write(f"  📋 {self.style.SUCCESS('Copied to clipboard!')}")
-        except ImportError:
-            self.stdout.write(
-                f"  📋 {self.style.WARNING('pyperclip not installed - skipping clipboard copy')}"
-            )
+            return f"  📋 {self.style.SUCCESS('Copied to clipboard!')}"
         except Exception:
-            pass
+            return None
@@ -1,4 +1,6 @@
 from enum import IntEnum, StrEnum
+from functools import cache
+from os import environ
 from shutil import get_terminal_size
 
 from django.core.management.base import BaseCommand
@@ -27,6 +29,100 @@ class TerminalSize(IntEnum):
     THRESHOLD = 60
 
 
+# ASCII art is built once at import; ArtPrinter only selects the variant to show.
+
+_PROG_NAME_ART_WIDE: tuple[str, ...] = (
+    "",
+    "  ██████╗      ██╗ ▄▄▄▄▄  ███╗   ██╗ ██████╗ ██╗  ██╗",
+    "  ██╔══██╗     ██║██╔══██╗████╗  ██║██╔════╝ ╚██╗██╔╝",
+    "  ██║  ██║     ██║███████║██╔██╗ ██║██║  ███╗ ╚███╔╝ ",
+    "  ██║  ██║██   ██║██╔══██║██║╚██╗██║██║   ██║ ██╔██╗ ",
+    "  ██████╔╝╚█████╔╝██║  ██║██║ ╚████║╚██████╔╝██╔╝ ██╗",
+    "  ╚═════╝  ╚════╝ ╚═╝  ╚═╝╚═╝  ╚═══╝ ╚═════╝ ╚═╝  ╚═╝",
+    "",
+)
+
+_PROG_NAME_ART_COMPACT: tuple[str, ...] = (
+    "",
+    "  █▀▄ ░░█ █▀█ █▄░█ █▀▀ ▀▄▀",
+    "  █▄▀ █▄█ █▀█ █░▀█ █▄█ █░█",
+    "",
+)
+
+_DEV_ART_WIDE: tuple[str, ...] = _PROG_NAME_ART_WIDE + (
+    "        ██████╗ ███████╗██╗   ██╗",
+    "        ██╔══██╗██╔════╝██║   ██║",
+    "        ██║  ██║█████╗  ██║   ██║",
+    "        ██║  ██║██╔══╝  ╚██╗ ██╔╝",
+    "        ██████╔╝███████╗ ╚████╔╝ ",
+    "        ╚═════╝ ╚══════╝  ╚═══╝  ",
+    "",
+)
+
+_DEV_ART_COMPACT: tuple[str, ...] = _PROG_NAME_ART_COMPACT + (
+    "       █▀▄ █▀▀ █░█",
+    "       █▄▀ ██▄ ▀▄▀",
+    "",
+)
+
+_BUILD_ART_WIDE: tuple[str, ...] = _PROG_NAME_ART_WIDE + (
+    "        ██████╗ ██╗   ██╗██╗██╗     ██████╗ ",
+    "        ██╔══██╗██║   ██║██║██║     ██╔══██╗",
+    "        ██████╔╝██║   ██║██║██║     ██║  ██║",
+    "        ██╔══██╗██║   ██║██║██║     ██║  ██║",
+    "        ██████╔╝╚██████╔╝██║███████╗██████╔╝",
+    "        ╚═════╝  ╚═════╝ ╚═╝╚══════╝╚═════╝ ",
+    "",
+)
+
+_BUILD_ART_COMPACT: tuple[str, ...] = _PROG_NAME_ART_COMPACT + (
+    "       █▄▄ █░█ █ █░░ █▀▄",
+    "       █▄█ █▄█ █ █▄▄ █▄▀",
+    "",
+)
+
+_INSTALL_ART_WIDE: tuple[str, ...] = _PROG_NAME_ART_WIDE + (
+    "   ██╗███╗   ██╗███████╗████████╗ █████╗ ██╗     ██╗     ",
+    "   ██║████╗  ██║██╔════╝╚══██╔══╝██╔══██╗██║     ██║     ",
+    "   ██║██╔██╗ ██║███████╗   ██║   ███████║██║     ██║     ",
+    "   ██║██║╚██╗██║╚════██║   ██║   ██╔══██║██║     ██║     ",
+    "   ██║██║ ╚████║███████║   ██║   ██║  ██║███████╗███████╗",
+    "   ╚═╝╚═╝  ╚═══╝╚══════╝   ╚═╝   ╚═╝  ╚═╝╚══════╝╚══════╝",
+    "",
+)
+
+_INSTALL_ART_COMPACT: tuple[str, ...] = _PROG_NAME_ART_COMPACT + (
+    "    █ █▄░█ █▀ ▀█▀ ▄▀█ █░░ █░░",
+    "    █ █░▀█ ▄█ ░█░ █▀█ █▄▄ █▄▄",
+    "",
+)
+
+# (wide, compact) art for each art type
+_ART: dict[ArtType, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    ArtType.PROG_NAME: (_PROG_NAME_ART_WIDE, _PROG_NAME_ART_COMPACT),
+    ArtType.DEV: (_DEV_ART_WIDE, _DEV_ART_COMPACT),
+    ArtType.BUILD: (_BUILD_ART_WIDE, _BUILD_ART_COMPACT),
+    ArtType.INSTALL: (_INSTALL_ART_WIDE, _INSTALL_ART_COMPACT),
+}
+
+
+@cache
+def _get_terminal_width() -> int:
+    """Get the terminal width used to pick the banner variant.
+
+    The DJANGX_BANNER_WIDTH environment variable takes precedence, which
+    skips the terminal size query in CI and containers.
+    The result is computed once per process.
+
+    Returns:
+        The terminal width in columns.
+    """
+    try:
+        return int(environ[f"{PKG_NAME.upper()}_BANNER_WIDTH"])
+    except (KeyError, ValueError):
+        return get_terminal_size(fallback=(80, 24)).columns
+
+
 class ArtPrinter:
     """Handles printing of ASCII art banners with terminal adaptation.
 
@@ -41,138 +137,61 @@ class ArtPrinter:
             command: The Django BaseCommand instance for stdout/styling.
         """
         self.command = command
-        self.terminal_width = get_terminal_size(fallback=(80, 24)).columns
-
-    def _get_prog_name_art(self) -> list[str]:
-        """Get ASCII art based on terminal width.
+        self.terminal_width = _get_terminal_width()
 
-        Returns:
-            List of strings representing the ASCII art lines.
-        """
-        if self.terminal_width >= TerminalSize.THRESHOLD:
-            return [
-                "",
-                "  ██████╗      ██╗ ▄▄▄▄▄  ███╗   ██╗ ██████╗ ██╗  ██╗",
-                "  ██╔══██╗     ██║██╔══██╗████╗  ██║██╔════╝ ╚██╗██╔╝",
-                "  ██║  ██║     ██║███████║██╔██╗ ██║██║  ███╗ ╚███╔╝ ",
-                "  ██║  ██║██   ██║██╔══██║██║╚██╗██║██║   ██║ ██╔██╗ ",
-                "  ██████╔╝╚█████╔╝██║  ██║██║ ╚████║╚██████╔╝██╔╝ ██╗",
-                "  ╚═════╝  ╚════╝ ╚═╝  ╚═╝╚═╝  ╚═══╝ ╚═════╝ ╚═╝  ╚═╝",
-                "",
-            ]
-        else:
-            return [
-                "",
-                "  █▀▄ ░░█ █▀█ █▄░█ █▀▀ ▀▄▀",
-                "  █▄▀ █▄█ █▀█ █░▀█ █▄█ █░█",
-                "",
-            ]
+    def _get_art(self, art_type: ArtType) -> tuple[str, ...]:
+        """Get ASCII art lines for the specified type based on terminal width.
 
-    def _get_dev_art(self) -> list[str]:
-        """Get Dev server ASCII art based on terminal width.
+        Args:
+            art_type: The type of ASCII art to retrieve.
 
         Returns:
-            List of strings representing the ASCII art lines.
-        """
-        prog_name_art = self._get_prog_name_art()
-
-        if self.terminal_width >= TerminalSize.THRESHOLD:
-            dev_art = [
-                "        ██████╗ ███████╗██╗   ██╗",
-                "        ██╔══██╗██╔════╝██║   ██║",
-                "        ██║  ██║█████╗  ██║   ██║",
-                "        ██║  ██║██╔══╝  ╚██╗ ██╔╝",
-                "        ██████╔╝███████╗ ╚████╔╝ ",
-                "        ╚═════╝ ╚══════╝  ╚═══╝  ",
-                "",
-            ]
-        else:
-            dev_art = [
-                "       █▀▄ █▀▀ █░█",
-                "       █▄▀ ██▄ ▀▄▀",
-                "",
-            ]
+            Tuple of strings representing the ASCII art lines.
 
-        return prog_name_art + dev_art
-
-    def _get_build_art(self) -> list[str]:
-        """Get Build ASCII art based on terminal width.
-
-        Returns:
-            List of strings representing the ASCII art lines.
+        Raises:
+            ValueError: If an unknown art type is provided.
         """
-        prog_name_art = self._get_prog_name_art()
+        art = _ART.get(art_type)
+        if art is None:
+            raise ValueError(f"Unknown art type: {art_type}")
 
-        if self.terminal_width >= TerminalSize.THRESHOLD:
-            build_art = [
-                "        ██████╗ ██╗   ██╗██╗██╗     ██████╗ ",
-                "        ██╔══██╗██║   ██║██║██║     ██╔══██╗",
-                "        ██████╔╝██║   ██║██║██║     ██║  ██║",
-                "        ██╔══██╗██║   ██║██║██║     ██║  ██║",
-                "        ██████╔╝╚██████╔╝██║███████╗██████╔╝",
-                "        ╚═════╝  ╚═════╝ ╚═╝╚══════╝╚═════╝ ",
-                "",
-            ]
-        else:
-            build_art = [
-                "       █▄▄ █░█ █ █░░ █▀▄",
-                "       █▄█ █▄█ █ █▄▄ █▄▀",
-                "",
-            ]
+        wide, compact = art
+        return wide if self.terminal_width >= TerminalSize.THRESHOLD else compact
 
-        return prog_name_art + build_art
+    def _get_banner_lines(
+        self,
+        art_type: ArtType,
+        title: str,
+        subtitle: str | None = None,
+        notice: str | None = None,
+    ) -> list[str]:
+        """Build the styled lines of an ASCII art banner.
 
-    def _get_install_art(self) -> list[str]:
-        """Get Install ASCII art based on terminal width.
+        Args:
+            art_type: The type of ASCII art to display.
+            title: Main title text (e.g., "🔥  Development Server  🔥").
+            subtitle: Optional subtitle text (e.g., warning messages).
+            notice: Optional notice text (e.g., "Press Ctrl-C to quit").
 
         Returns:
-            List of strings representing the ASCII art lines.
+            List of styled lines, ending with an empty spacing line.
         """
-        prog_name_art = self._get_prog_name_art()
-
-        if self.terminal_width >= TerminalSize.THRESHOLD:
-            install_art = [
-                "   ██╗███╗   ██╗███████╗████████╗ █████╗ ██╗     ██╗     ",
-                "   ██║████╗  ██║██╔════╝╚══██╔══╝██╔══██╗██║     ██║     ",
-                "   ██║██╔██╗ ██║███████╗   ██║   ███████║██║     ██║     ",
-                "   ██║██║╚██╗██║╚════██║   ██║   ██╔══██║██║     ██║     ",
-                "   ██║██║ ╚████║███████║   ██║   ██║  ██║███████╗███████╗",
-                "   ╚═╝╚═╝  ╚═══╝╚══════╝   ╚═╝   ╚═╝  ╚═╝╚══════╝╚══════╝",
-                "",
-            ]
-        else:
-            install_art = [
-                "    █ █▄░█ █▀ ▀█▀ ▄▀█ █░░ █░░",
-                "    █ █░▀█ ▄█ ░█░ █▀█ █▄▄ █▄▄",
-                "",
-            ]
+        style = self.command.style
 
-        return prog_name_art + install_art
+        # ASCII art and title
+        lines = [style.HTTP_INFO(line) for line in self._get_art(art_type)]
+        lines.append(style.HTTP_INFO(title))
 
-    def _get_art(self, art_type: ArtType) -> list[str]:
-        """Get ASCII art lines for the specified type.
-
-        Args:
-            art_type: The type of ASCII art to retrieve.
-
-        Returns:
-            List of strings representing the ASCII art lines.
+        # Subtitle if provided
+        if subtitle:
+            lines.append(style.WARNING(subtitle))
 
-        Raises:
-            ValueError: If an unknown art type is provided.
-        """
-        art_getters = {
-            ArtType.PROG_NAME: self._get_prog_name_art,
-            ArtType.DEV: self._get_dev_art,
-            ArtType.BUILD: self._get_build_art,
-            ArtType.INSTALL: self._get_install_art,
-        }
-
-        getter = art_getters.get(art_type)
-        if getter is None:
-            raise ValueError(f"Unknown art type: {art_type}")
+        # Notice if provided
+        if notice:
+            lines.append(style.NOTICE(notice))
 
-        return getter()
+        lines.append("")
+        return lines
 
     def _print_banner(
         self,
@@ -183,42 +202,28 @@ class ArtPrinter:
     ) -> None:
         """Print a complete ASCII art banner with optional subtitle and notice.
 
+        The banner is written in a single call rather than line by line.
+
         Args:
             art_type: The type of ASCII art to display.
             title: Main title text (e.g., "🔥  Development Server  🔥").
             subtitle: Optional subtitle text (e.g., warning messages).
             notice: Optional notice text (e.g., "Press Ctrl-C to quit").
         """
-        art_lines = self._get_art(art_type)
-
-        # Print ASCII art
-        for line in art_lines:
-            self.command.stdout.write(self.command.style.HTTP_INFO(line))
-
-        # Print title
-        self.command.stdout.write(self.command.style.HTTP_INFO(title))
+        lines = self._get_banner_lines(art_type, title, subtitle, notice)
+        self.command.stdout.write("\n".join(lines) + "\n")
 
-        # Print subtitle if provided
-        if subtitle:
-            self.command.stdout.write(self.command.style.WARNING(subtitle))
-
-        # Print notice if provided
-        if notice:
-            self.command.stdout.write(self.command.style.NOTICE(notice))
-
-        self.command.stdout.write("")
-
-    def print_dev_banner(self) -> None:
-        """Print the development server banner."""
+    def get_dev_banner_lines(self) -> list[str]:
+        """Get the styled lines of the development server banner."""
         if self.terminal_width >= TerminalSize.THRESHOLD:
-            self._print_banner(
+            return self._get_banner_lines(
                 art_type=ArtType.DEV,
                 title="         🔥  Development Server  🔥",
                 subtitle="       ⚠️  Not suitable for production!  ⚠️",
                 notice="             Press Ctrl-C to quit",
             )
         else:
-            self._print_banner(
+            return self._get_banner_lines(
                 art_type=ArtType.DEV,
                 title="    🔥  Dev Server  🔥",
                 subtitle="  ⚠️   Not for production! ⚠️",
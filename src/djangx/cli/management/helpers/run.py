@@ -5,8 +5,13 @@ Supports dry-run mode for previewing commands before execution
 and continues running remaining commands even if one fails.
 """
 
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from os import cpu_count
+from subprocess import run
 
 from django.core.management import call_command
 from django.core.management.base import BaseCommand, CommandError
@@ -23,11 +28,13 @@ class CommandResult:
         command: The command that was executed.
         success: Whether the command executed successfully.
         error: Error message if the command failed, None otherwise.
+        output: Captured output when the command ran in a separate process.
     """
 
     command: str
     success: bool
     error: str | None = None
+    output: str = ""
 
 
 class CommandOutput(ABC):
@@ -133,7 +140,9 @@ class CommandExecutor:
         """Execute a single command.
 
         Parses the command string, invokes the management command via call_command,
-        and returns the result with any error information.
+        and returns the result with any error information. The command writes to
+        the parent command's stdout/stderr so its output stays in order with the
+        progress output.
 
         Args:
             cmd: The command string to execute (e.g., 'collectstatic --noinput').
@@ -154,8 +163,15 @@ class CommandExecutor:
             command_name: str = parts[0]
             command_args: list[str] = parts[1:]
 
-            # Execute the management command
-            call_command(command_name, *command_args)
+            # Execute the management command, writing to the parent's underlying streams.
+            # Passing the OutputWrappers themselves would wrap them twice, and the inner
+            # wrapper would add a line break to every write(..., ending="").
+            call_command(
+                command_name,
+                *command_args,
+                stdout=self.command.stdout._out,
+                stderr=self.command.stderr._out,
+            )
 
             return CommandResult(command=cmd, success=True)
         except CommandError as e:
@@ -163,6 +179,41 @@ class CommandExecutor:
         except (ValueError, OSError) as e:
             return CommandResult(command=cmd, success=False, error=str(e))
 
+    def execute_in_subprocess(self, cmd: str) -> CommandResult:
+        """Execute a single command in a separate Python process.
+
+        Used for commands that run concurrently, since call_command shares
+        Django state and is not safe to call from several threads at once.
+        Output is captured so it can be written once the command finishes.
+
+        Args:
+            cmd: The command string to execute (e.g., 'collectstatic --noinput').
+
+        Returns:
+            CommandResult containing execution status, error details and output.
+        """
+        parts: list[str] = cmd.strip().split()
+        if not parts:
+            return CommandResult(command=cmd, success=False, error="Empty command string")
+
+        try:
+            completed = run(
+                [sys.executable, "-m", f"{PKG_NAME}.cli.manage", *parts],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except OSError as e:
+            return CommandResult(command=cmd, success=False, error=str(e))
+
+        output = completed.stdout + completed.stderr
+        if completed.returncode == 0:
+            return CommandResult(command=cmd, success=True, output=output)
+
+        error_lines = completed.stderr.strip().splitlines()
+        error = error_lines[-1] if error_lines else f"Exited with code {completed.returncode}"
+        return CommandResult(command=cmd, success=False, error=error, output=output)
+
 
 class CommandProcess:
     """Orchestrator for the command execution process.
@@ -175,6 +226,7 @@ class CommandProcess:
         output: The output handler for displaying information.
         executor: The command executor for running commands.
         mode: The mode of operation (e.g., 'BUILD', 'INSTALL').
+        parallel: Command names that may run concurrently with each other.
     """
 
     def __init__(
@@ -183,6 +235,7 @@ class CommandProcess:
         output: CommandOutput,
         executor: CommandExecutor,
         mode: str,
+        parallel: list[str] | None = None,
     ) -> None:
         """Initialize the command process.
 
@@ -191,11 +244,13 @@ class CommandProcess:
             output: The output handler for displaying information.
             executor: The command executor for running commands.
             mode: The mode of operation (e.g., 'BUILD', 'INSTALL').
+            parallel: Command names that may run concurrently with each other.
         """
         self.command = command
         self.output = output
         self.executor = executor
         self.mode = mode
+        self.parallel = frozenset(parallel or ())
 
     def run(self, commands: list[str], dry_run: bool = False) -> None:
         """Run the command process.
@@ -213,7 +268,10 @@ class CommandProcess:
         self._execute_commands(commands)
 
     def _execute_commands(self, commands: list[str]) -> None:
-        """Execute all commands sequentially.
+        """Execute all commands in order.
+
+        Consecutive commands marked as parallel run concurrently; every
+        other command runs sequentially.
 
         Args:
             commands: List of commands to execute.
@@ -221,22 +279,72 @@ class CommandProcess:
         total = len(commands)
         completed = 0
         failed = 0
-        results: list[CommandResult] = []
 
-        for i, cmd in enumerate(commands, 1):
-            self.output.print_command_header()
-            result = self.executor.execute(cmd)
-            results.append(result)
+        i = 0
+        for group in self._group_commands(commands):
+            for result in self._execute_group(group):
+                i += 1
 
-            if result.success:
-                self.output.print_command_success(cmd, i, total)
-                completed += 1
-            else:
-                self.output.print_command_failure(cmd, result.error or "Unknown error", i, total)
-                failed += 1
+                if result.success:
+                    self.output.print_command_success(result.command, i, total)
+                    completed += 1
+                else:
+                    self.output.print_command_failure(
+                        result.command, result.error or "Unknown error", i, total
+                    )
+                    failed += 1
 
         self.output.print_summary(total, completed, failed)
 
+    def _group_commands(self, commands: list[str]) -> Iterator[list[str]]:
+        """Split commands into groups that can be executed together.
+
+        Args:
+            commands: List of commands to execute.
+
+        Yields:
+            Runs of consecutive parallel commands, or single sequential commands.
+        """
+        group: list[str] = []
+
+        for cmd in commands:
+            parts = cmd.split()
+            if parts and parts[0] in self.parallel:
+                group.append(cmd)
+                continue
+
+            if group:
+                yield group
+                group = []
+            yield [cmd]
+
+        if group:
+            yield group
+
+    def _execute_group(self, group: list[str]) -> Iterator[CommandResult]:
+        """Execute a group of commands, yielding results as they finish.
+
+        Args:
+            group: Commands to execute together.
+
+        Yields:
+            CommandResult for each command, in order of completion.
+        """
+        if len(group) == 1:
+            self.output.print_command_header()
+            yield self.executor.execute(group[0])
+            return
+
+        with ThreadPoolExecutor(max_workers=min(len(group), cpu_count() or 1)) as pool:
+            futures = [pool.submit(self.executor.execute_in_subprocess, cmd) for cmd in group]
+
+            for future in as_completed(futures):
+                result = future.result()
+                self.output.print_command_header()
+                if result.output:
+                    self.command.stdout.write(result.output, ending="")
+                yield result
+
 
 class CommandGenerator(ABC):
     """Base generator for creating command execution processes.
@@ -280,6 +388,14 @@ class CommandGenerator(ABC):
         """
         pass
 
+    def get_parallel_commands(self) -> list[str]:
+        """Retrieve the names of commands that may run concurrently.
+
+        Returns:
+            List of command names. Empty by default, so all commands run sequentially.
+        """
+        return []
+
     def generate(self, dry_run: bool = False) -> None:
         """Generate and execute the command process.
 
@@ -296,7 +412,13 @@ class CommandGenerator(ABC):
         # Initialize components
         output = self.create_output_handler()
         executor = CommandExecutor(self.django_command)
-        process = CommandProcess(self.django_command, output, executor, self.get_mode())
+        process = CommandProcess(
+            self.django_command,
+            output,
+            executor,
+            self.get_mode(),
+            parallel=self.get_parallel_commands(),
+        )
 
         # Run the process
         process.run(commands, dry_run=dry_run)
@@ -320,6 +442,15 @@ class Output(CommandOutput):
         self.art_type = art_type
         self.art_printer = ArtPrinter(command)
 
+        # Bind style callables once instead of looking them up on every write
+        style = command.style
+        self._success = style.SUCCESS
+        self._error = style.ERROR
+        self._warning = style.WARNING
+        self._notice = style.NOTICE
+        self._info = style.HTTP_INFO
+        self._not_modified = style.HTTP_NOT_MODIFIED
+
     def print_header(self, command_count: int, dry_run: bool, mode: str) -> None:
         """Print the command process header with ASCII art.
 
@@ -331,7 +462,7 @@ class Output(CommandOutput):
         display_mode = "DRY RUN" if dry_run else mode
 
         self.command.stdout.write(
-            self.command.style.SUCCESS(f"\n✨ Starting {display_mode.lower()} process...\n")
+            self._success(f"\n✨ Starting {display_mode.lower()} process...\n")
         )
 
         self.art_printer.print_run_process_banner(self.art_type, display_mode, command_count)
@@ -342,9 +473,9 @@ class Output(CommandOutput):
         Args:
             mode: The mode of operation (e.g., 'build', 'install').
         """
-        self.command.stdout.write(self.command.style.ERROR(f"\n❌ No {mode} commands configured!"))
+        self.command.stdout.write(self._error(f"\n❌ No {mode} commands configured!"))
         self.command.stdout.write(
-            self.command.style.WARNING(
+            self._warning(
                 f"   Define {mode} commands in your '.env' file or in pyproject.toml [tool.{PKG_NAME}] section:\n"
             )
         )
@@ -356,24 +487,20 @@ class Output(CommandOutput):
         Args:
             commands: List of commands to preview.
         """
-        self.command.stdout.write(self.command.style.NOTICE("Commands to be executed:\n"))
+        self.command.stdout.write(self._notice("Commands to be executed:\n"))
 
         for i, cmd in enumerate(commands, 1):
-            self.command.stdout.write(
-                f"  {self.command.style.NOTICE(f'[{i}]')} {self.command.style.HTTP_INFO(cmd)}"
-            )
+            self.command.stdout.write(f"  {self._notice(f'[{i}]')} {self._info(cmd)}")
 
         self.command.stdout.write("")
         self.command.stdout.write(
-            self.command.style.HTTP_NOT_MODIFIED(
-                "✨ Remove --dry-run flag to execute these commands"
-            )
+            self._not_modified("✨ Remove --dry-run flag to execute these commands")
         )
         self.command.stdout.write("")
 
     def print_command_header(self) -> None:
         """Print the command header before execution."""
-        self.command.stdout.write(self.command.style.HTTP_NOT_MODIFIED("=" * 60 + "\n"))
+        self.command.stdout.write(self._not_modified("=" * 60 + "\n"))
 
     def print_command_success(self, cmd: str, index: int, total: int) -> None:
         """Print successful command completion with progress bar.
@@ -385,7 +512,7 @@ class Output(CommandOutput):
         """
         progress_bar = self._create_progress_bar(index, total)
         self.command.stdout.write(f"\n{progress_bar}")
-        self.command.stdout.write(self.command.style.SUCCESS(f"✓ Completed: {cmd}"))
+        self.command.stdout.write(self._success(f"✓ Completed: {cmd}"))
         self.command.stdout.write("")
 
     def print_command_failure(self, cmd: str, error: str, index: int, total: int) -> None:
@@ -399,8 +526,8 @@ class Output(CommandOutput):
         """
         progress_bar = self._create_progress_bar(index, total)
         self.command.stdout.write(f"\n{progress_bar}")
-        self.command.stdout.write(self.command.style.ERROR(f"✗ Failed: {cmd}"))
-        self.command.stdout.write(self.command.style.ERROR(f"   Error: {error}"))
+        self.command.stdout.write(self._error(f"✗ Failed: {cmd}"))
+        self.command.stdout.write(self._error(f"   Error: {error}"))
         self.command.stdout.write("")
 
     def print_summary(self, total: int, completed: int, failed: int) -> None:
@@ -411,18 +538,14 @@ class Output(CommandOutput):
             completed: Number of successfully completed commands.
             failed: Number of failed commands.
         """
-        self.command.stdout.write(self.command.style.HTTP_NOT_MODIFIED("=" * 60 + "\n"))
+        self.command.stdout.write(self._not_modified("=" * 60 + "\n"))
         if failed == 0:
             self.command.stdout.write(
-                self.command.style.SUCCESS(f"🎉 All {completed} command(s) completed successfully!")
+                self._success(f"🎉 All {completed} command(s) completed successfully!")
             )
         else:
-            self.command.stdout.write(
-                self.command.style.SUCCESS(f"✓ {completed}/{total} command(s) completed")
-            )
-            self.command.stdout.write(
-                self.command.style.ERROR(f"✗ {failed}/{total} command(s) failed")
-            )
+            self.command.stdout.write(self._success(f"✓ {completed}/{total} command(s) completed"))
+            self.command.stdout.write(self._error(f"✗ {failed}/{total} command(s) failed"))
 
         self.command.stdout.write("")
 
@@ -441,8 +564,4 @@ class Output(CommandOutput):
         bar = "█" * filled + "░" * (bar_length - filled)
         percentage = (current / total) * 100
 
-        return (
-            f"  [{bar}] "
-            f"{self.command.style.HTTP_INFO(f'{current}/{total}')} "
-            f"({self.command.style.NOTICE(f'{percentage:.0f}%')})"
-        )
+        return f"  [{bar}] {self._info(f'{current}/{total}')} ({self._notice(f'{percentage:.0f}%')})"
@@ -1,12 +1,12 @@
 from pathlib import Path
 
-from ... import Conf, ConfField
+from ... import PROJECT_PATH, Conf, ConfField
 
 
 class FileGeneratorPathsConf(Conf):
     """Generated files configuration settings."""
 
-    _base_dir = Path.cwd()
+    _base_dir = PROJECT_PATH
 
     dotenv_example = ConfField(default=_base_dir / ".env.example", type=Path)
     vercel_json = ConfField(default=_base_dir / "vercel.json", type=Path)
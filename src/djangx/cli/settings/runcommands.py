@@ -15,6 +15,13 @@ class RunCommandsConf(Conf):
         default=["makemigrations", "migrate", "collectstatic --noinput"],
         type=list,
     )
+    # Build command names that are safe to run concurrently. Consecutive build
+    # commands listed here are executed together in separate processes.
+    build_parallel = ConfField(
+        env="RUNCOMMANDS_BUILD_PARALLEL",
+        toml="runcommands.build-parallel",
+        type=list,
+    )
 
 
 RUNCOMMANDS = RunCommandsConf()
@@ -1,31 +1,35 @@
 from pathlib import Path
 
-from ... import PKG_PATH, Conf, ConfField
+from ... import PKG_PATH, PROJECT_PATH, Conf, ConfField
+
+# Defaults are resolved once at import; expanduser() reads the environment / passwd db
+_DEFAULT_VERSION = "v4.1.18"
+_DEFAULT_CLI: Path = Path(f"~/.local/bin/tailwind-{_DEFAULT_VERSION}.exe").expanduser()
+_DEFAULT_SOURCE: Path = PROJECT_PATH / "app" / "static" / "app" / "index.css"
+_DEFAULT_OUTPUT: Path = PKG_PATH / "ui" / "static" / "ui" / "css" / "tailwind.min.css"
 
 
 class TailwindConf(Conf):
     """Tailwind configuration settings."""
 
-    _default_version = "v4.1.18"
-
     version = ConfField(
         env="TAILWIND_VERSION",
         toml="tailwind.version",
-        default=_default_version,
+        default=_DEFAULT_VERSION,
         type=str,
     )
     cli = ConfField(
         env="TAILWIND_CLI",
         toml="tailwind.cli",
-        default=Path(f"~/.local/bin/tailwind-{_default_version}.exe").expanduser(),
+        default=_DEFAULT_CLI,
         type=Path,
     )
     source = ConfField(
-        default=Path.cwd() / "app" / "static" / "app" / "index.css",
+        default=_DEFAULT_SOURCE,
         type=Path,
     )
     output = ConfField(
-        default=PKG_PATH / "ui" / "static" / "ui" / "css" / "tailwind.min.css",
+        default=_DEFAULT_OUTPUT,
         type=Path,
     )
 
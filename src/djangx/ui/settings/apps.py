@@ -1,24 +1,40 @@
-from enum import StrEnum
+from itertools import chain
+from typing import Final, Iterable
 
 from ... import PKG_NAME, Conf, ConfField
 from ..types import TemplatesDict
 
+
+def _unique(*groups: Iterable[str]) -> list[str]:
+    """Concatenate groups in order, keeping the first occurrence of each entry."""
+    return list(dict.fromkeys(chain.from_iterable(groups)))
+
+
+def _required_apps(app_map: dict[str, tuple[str, ...]]) -> dict[str, tuple[str, ...]]:
+    """Invert an app -> entries map into entry -> apps that entry requires."""
+    required: dict[str, tuple[str, ...]] = {}
+    for app, entries in app_map.items():
+        for entry in entries:
+            required[entry] = (*required.get(entry, ()), app)
+    return required
+
+
 # ===============================================================
 # Apps
 # ===============================================================
 
 
-class _Apps(StrEnum):
-    """Django applications enumeration."""
+class _Apps:
+    """Django application names."""
 
-    ADMIN = "django.contrib.admin"
-    AUTH = "django.contrib.auth"
-    CONTENTTYPES = "django.contrib.contenttypes"
-    SESSIONS = "django.contrib.sessions"
-    MESSAGES = "django.contrib.messages"
-    STATICFILES = "django.contrib.staticfiles"
-    BROWSER_RELOAD = "django_browser_reload"
-    WATCHFILES = "django_watchfiles"
+    ADMIN: Final = "django.contrib.admin"
+    AUTH: Final = "django.contrib.auth"
+    CONTENTTYPES: Final = "django.contrib.contenttypes"
+    SESSIONS: Final = "django.contrib.sessions"
+    MESSAGES: Final = "django.contrib.messages"
+    STATICFILES: Final = "django.contrib.staticfiles"
+    BROWSER_RELOAD: Final = "django_browser_reload"
+    WATCHFILES: Final = "django_watchfiles"
 
 
 class AppsConf(Conf):
@@ -46,17 +62,15 @@ def _get_installed_apps() -> list[str]:
         _Apps.WATCHFILES,
     ]
 
-    # Collect apps that should be removed except for base apps
-    apps_to_remove = [app for app in _APPS_CONF.remove if app not in base_apps]
-
-    # Remove apps that are in the remove list
-    django_apps = [app for app in django_apps if app not in apps_to_remove]
+    # Base apps are never in django_apps, so removal can only affect django apps
+    apps_to_remove = set(_APPS_CONF.remove)
 
-    # Add custom apps
-    all_apps = base_apps + django_apps + _APPS_CONF.extend
-
-    # Remove duplicates while preserving order
-    return list(dict.fromkeys(all_apps))
+    # Combine base, remaining django and custom apps without duplicates
+    return _unique(
+        base_apps,
+        (app for app in django_apps if app not in apps_to_remove),
+        _APPS_CONF.extend,
+    )
 
 
 INSTALLED_APPS: list[str] = _get_installed_apps()
@@ -67,20 +81,22 @@ INSTALLED_APPS: list[str] = _get_installed_apps()
 # ===============================================================
 
 
-class _ContextProcessors(StrEnum):
-    """Django template context processors enumeration."""
+class _ContextProcessors:
+    """Django template context processor paths."""
 
-    CSP = "django.template.context_processors.csp"
-    REQUEST = "django.template.context_processors.request"
-    AUTH = "django.contrib.auth.context_processors.auth"
-    MESSAGES = "django.contrib.messages.context_processors.messages"
+    CSP: Final = "django.template.context_processors.csp"
+    REQUEST: Final = "django.template.context_processors.request"
+    AUTH: Final = "django.contrib.auth.context_processors.auth"
+    MESSAGES: Final = "django.contrib.messages.context_processors.messages"
 
 
-_APP_CONTEXT_PROCESSOR_MAP: dict[_Apps, list[_ContextProcessors]] = {
-    _Apps.AUTH: [_ContextProcessors.AUTH],
-    _Apps.MESSAGES: [_ContextProcessors.MESSAGES],
+_APP_CONTEXT_PROCESSOR_MAP: dict[str, tuple[str, ...]] = {
+    _Apps.AUTH: (_ContextProcessors.AUTH,),
+    _Apps.MESSAGES: (_ContextProcessors.MESSAGES,),
 }
 
+_CONTEXT_PROCESSOR_REQUIRED_APPS = _required_apps(_APP_CONTEXT_PROCESSOR_MAP)
+
 
 class ContextProcessorsConf(Conf):
     """Context processors configuration settings."""
@@ -109,22 +125,19 @@ def _get_context_processors(installed_apps: list[str]) -> list[str]:
         _ContextProcessors.MESSAGES,
     ]
 
-    # Collect context processors that should be removed based on missing apps
-    context_processors_to_remove: set[str] = set(_CONTEXT_PROCESSORS_CONF.remove)
-    for app, processor_list in _APP_CONTEXT_PROCESSOR_MAP.items():
-        if app not in installed_apps:
-            context_processors_to_remove.update(processor_list)
-
-    # Filter out context processors whose apps are not installed or explicitly removed
-    base_context_processors = [
-        cp for cp in base_context_processors if cp not in context_processors_to_remove
-    ]
+    installed = set(installed_apps)
+    removed = set(_CONTEXT_PROCESSORS_CONF.remove)
 
-    # Add custom context processors
-    all_context_processors = base_context_processors + _CONTEXT_PROCESSORS_CONF.extend
+    # Keep context processors whose apps are installed and that are not explicitly removed
+    kept = (
+        cp
+        for cp in base_context_processors
+        if cp not in removed
+        and all(app in installed for app in _CONTEXT_PROCESSOR_REQUIRED_APPS.get(cp, ()))
+    )
 
-    # Remove duplicates while preserving order
-    return list(dict.fromkeys(all_context_processors))
+    # Add custom context processors and drop duplicates
+    return _unique(kept, _CONTEXT_PROCESSORS_CONF.extend)
 
 
 TEMPLATES: TemplatesDict = [
@@ -145,27 +158,29 @@ TEMPLATES: TemplatesDict = [
 # ===============================================================
 
 
-class _Middlewares(StrEnum):
-    """Django middleware enumeration."""
+class _Middlewares:
+    """Django middleware paths."""
 
-    SECURITY = "django.middleware.security.SecurityMiddleware"
-    SESSION = "django.contrib.sessions.middleware.SessionMiddleware"
-    COMMON = "django.middleware.common.CommonMiddleware"
-    CSRF = "django.middleware.csrf.CsrfViewMiddleware"
-    AUTH = "django.contrib.auth.middleware.AuthenticationMiddleware"
-    MESSAGES = "django.contrib.messages.middleware.MessageMiddleware"
-    CLICKJACKING = "django.middleware.clickjacking.XFrameOptionsMiddleware"
-    CSP = "django.middleware.csp.ContentSecurityPolicyMiddleware"
-    BROWSER_RELOAD = "django_browser_reload.middleware.BrowserReloadMiddleware"
+    SECURITY: Final = "django.middleware.security.SecurityMiddleware"
+    SESSION: Final = "django.contrib.sessions.middleware.SessionMiddleware"
+    COMMON: Final = "django.middleware.common.CommonMiddleware"
+    CSRF: Final = "django.middleware.csrf.CsrfViewMiddleware"
+    AUTH: Final = "django.contrib.auth.middleware.AuthenticationMiddleware"
+    MESSAGES: Final = "django.contrib.messages.middleware.MessageMiddleware"
+    CLICKJACKING: Final = "django.middleware.clickjacking.XFrameOptionsMiddleware"
+    CSP: Final = "django.middleware.csp.ContentSecurityPolicyMiddleware"
+    BROWSER_RELOAD: Final = "django_browser_reload.middleware.BrowserReloadMiddleware"
 
 
-_APP_MIDDLEWARE_MAP: dict[_Apps, list[_Middlewares]] = {
-    _Apps.SESSIONS: [_Middlewares.SESSION],
-    _Apps.AUTH: [_Middlewares.AUTH],
-    _Apps.MESSAGES: [_Middlewares.MESSAGES],
-    _Apps.BROWSER_RELOAD: [_Middlewares.BROWSER_RELOAD],
+_APP_MIDDLEWARE_MAP: dict[str, tuple[str, ...]] = {
+    _Apps.SESSIONS: (_Middlewares.SESSION,),
+    _Apps.AUTH: (_Middlewares.AUTH,),
+    _Apps.MESSAGES: (_Middlewares.MESSAGES,),
+    _Apps.BROWSER_RELOAD: (_Middlewares.BROWSER_RELOAD,),
 }
 
+_MIDDLEWARE_REQUIRED_APPS = _required_apps(_APP_MIDDLEWARE_MAP)
+
 
 class MiddlewareConf(Conf):
     """Middleware configuration settings."""
@@ -191,20 +206,18 @@ def _get_middleware(installed_apps: list[str]) -> list[str]:
         _Middlewares.BROWSER_RELOAD,
     ]
 
-    # Collect middleware that should be removed based on missing apps
-    middleware_to_remove: set[str] = set(_MIDDLEWARE_CONF.remove)
-    for app, middleware_list in _APP_MIDDLEWARE_MAP.items():
-        if app not in installed_apps:
-            middleware_to_remove.update(middleware_list)
-
-    # Filter out middleware whose apps are not installed or explicitly removed
-    base_middleware = [m for m in base_middleware if m not in middleware_to_remove]
+    installed = set(installed_apps)
+    removed = set(_MIDDLEWARE_CONF.remove)
 
-    # Add custom middleware
-    all_middleware = base_middleware + _MIDDLEWARE_CONF.extend
+    # Keep middleware whose apps are installed and that are not explicitly removed
+    kept = (
+        m
+        for m in base_middleware
+        if m not in removed and all(app in installed for app in _MIDDLEWARE_REQUIRED_APPS.get(m, ()))
+    )
 
-    # Remove duplicates while preserving order
-    return list(dict.fromkeys(all_middleware))
+    # Add custom middleware and drop duplicates
+    return _unique(kept, _MIDDLEWARE_CONF.extend)
 
 
 MIDDLEWARE: list[str] = _get_middleware(INSTALLED_APPS)
@@ -1,8 +1,10 @@
-from typing import Literal, TypeAlias
+from functools import cache
+from typing import Any, Callable, Literal, TypeAlias
 
 from django import template
 
 from ..settings import CONTACTINFO_ADDRESS, CONTACTINFO_EMAIL, CONTACTINFO_PHONE
+from ..settings.contactinfo import ContactInfoEmailConf, ContactInfoPhoneConf
 
 ContactAddressKey: TypeAlias = Literal[
     "country",
@@ -25,6 +27,29 @@ ContactPhoneKey: TypeAlias = Literal[
 register = template.Library()
 
 
+@cache
+def _collect(conf: ContactInfoEmailConf | ContactInfoPhoneConf) -> tuple[str, ...]:
+    """Return the primary value followed by the additional ones, built once per setting."""
+    primary = conf.primary
+    additional = conf.additional or ()
+    return (primary, *additional) if primary else tuple(additional)
+
+
+def _primary(conf: ContactInfoEmailConf | ContactInfoPhoneConf) -> str:
+    """Return the primary value, or an empty string."""
+    return conf.primary or ""
+
+
+# Email and phone settings share a shape, so one table serves both tags;
+# unknown keys fall back to the primary value. The tags hand out fresh lists,
+# keeping the cached tuples and the settings' own lists out of callers' reach.
+_CONTACT_GETTERS: dict[str, Callable[[Any], str | list[str]]] = {
+    "all": lambda conf: list(_collect(conf)),
+    "additional": lambda conf: list(conf.additional or []),
+    "primary": _primary,
+}
+
+
 @register.simple_tag
 def contactinfo_address(key: ContactAddressKey | Literal["full"]) -> str:
     """Returns the specified address field from contact address setting."""
@@ -32,60 +57,37 @@ def contactinfo_address(key: ContactAddressKey | Literal["full"]) -> str:
     contactinfo_address = CONTACTINFO_ADDRESS
 
     if key == "full":
-        address_parts: list[str | None] = [
-            contactinfo_address.street,
-            contactinfo_address.city,
-            contactinfo_address.state,
-            contactinfo_address.country,
-        ]
-        return ", ".join(filter(None, address_parts))
+        return ", ".join(
+            part
+            for part in (
+                contactinfo_address.street,
+                contactinfo_address.city,
+                contactinfo_address.state,
+                contactinfo_address.country,
+            )
+            if part
+        )
 
-    return getattr(contactinfo_address, key, "")
+    return getattr(contactinfo_address, key, "") or ""
 
 
 @register.simple_tag
 def contactinfo_email(key: ContactEmailKey | Literal["all"] = "primary") -> str | list[str]:
     """Returns the specified email field from contact email setting."""
 
-    contactinfo_email = CONTACTINFO_EMAIL
-
-    if key == "all":
-        emails: list[str] = []
-        if contactinfo_email.primary:
-            emails.append(contactinfo_email.primary)
-        if contactinfo_email.additional:
-            emails.extend(contactinfo_email.additional)
-        return emails
-
-    if key == "additional":
-        return contactinfo_email.additional or []
-
-    return contactinfo_email.primary or ""
+    return _CONTACT_GETTERS.get(key, _primary)(CONTACTINFO_EMAIL)
 
 
 @register.simple_tag
 def contactinfo_phone(key: ContactPhoneKey | Literal["all"] = "primary") -> str | list[str]:
     """Returns the specified phone field from contact phone setting."""
 
-    contactinfo_phone = CONTACTINFO_PHONE
+    return _CONTACT_GETTERS.get(key, _primary)(CONTACTINFO_PHONE)
 
-    if key == "all":
-        phones: list[str] = []
-        if contactinfo_phone.primary:
-            phones.append(contactinfo_phone.primary)
-        if contactinfo_phone.additional:
-            phones.extend(contactinfo_phone.additional)
-        return phones
 
-    if key == "additional":
-        return contactinfo_phone.additional or []
-
-    return contactinfo_phone.primary or ""
-
-
-@register.inclusion_tag("contactinfo/address_block.html")
-def contactinfo_address_block() -> dict[str, str]:
-    """Renders a formatted address block."""
+@cache
+def _address_block_context() -> dict[str, str]:
+    """Build the address block context once; the address settings never change."""
 
     contactinfo_address = CONTACTINFO_ADDRESS
 
@@ -97,29 +99,23 @@ def contactinfo_address_block() -> dict[str, str]:
     }
 
 
+@register.inclusion_tag("contactinfo/address_block.html")
+def contactinfo_address_block() -> dict[str, str]:
+    """Renders a formatted address block."""
+
+    # Copy, since Django writes the request's csrf_token into the returned dict
+    return _address_block_context().copy()
+
+
 @register.inclusion_tag("contactinfo/email_list.html")
 def contactinfo_email_list() -> dict[str, list[str]]:
     """Renders a list of all email addresses."""
 
-    contactinfo_email = CONTACTINFO_EMAIL
-
-    emails: list[str] = []
-    if contactinfo_email.primary:
-        emails.append(contactinfo_email.primary)
-    if contactinfo_email.additional:
-        emails.extend(contactinfo_email.additional)
-    return {"emails": emails}
+    return {"emails": list(_collect(CONTACTINFO_EMAIL))}
 
 
 @register.inclusion_tag("contactinfo/phone_list.html")
 def contactinfo_phone_list() -> dict[str, list[str]]:
     """Renders a list of all phone numbers."""
 
-    contactinfo_phone = CONTACTINFO_PHONE
-
-    phones: list[str] = []
-    if contactinfo_phone.primary:
-        phones.append(contactinfo_phone.primary)
-    if contactinfo_phone.additional:
-        phones.extend(contactinfo_phone.additional)
-    return {"phones": phones}
+    return {"phones": list(_collect(CONTACTINFO_PHONE))}
@@ -1,3 +1,5 @@
+from typing import get_args
+
 from django import template
 from django.templatetags.static import static
 
@@ -6,12 +8,15 @@ from ..types import OrgKey
 
 register = template.Library()
 
+# OrgKey -> ORG attribute, so known keys skip normalization on every render
+_ORG_ATTRS: dict[str, str] = {key: key.replace("-", "_") for key in get_args(OrgKey)}
+
 
 @register.simple_tag
 def org(key: OrgKey) -> str:
     """Return the organization name."""
     try:
-        org_key = key.lower().replace("-", "_")
+        org_key = _ORG_ATTRS.get(key) or key.lower().replace("-", "_")
 
         match org_key:
             case "logo_url" | "favicon_url" | "apple_touch_icon_url":
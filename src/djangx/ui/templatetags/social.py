@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, get_args
 
 from django.template import Library
 
@@ -7,6 +7,20 @@ from ..types import SocialKey
 
 register = Library()
 
+# (platform, SOCIAL_URLS attribute, icon, label) for each platform, in display order
+_SOCIAL_PLATFORM_META: tuple[tuple[str, str, str, str], ...] = tuple(
+    (
+        platform,
+        platform.replace("-", "_"),
+        SOCIAL_PLATFORM_ICONS_MAP[platform],
+        platform.replace("-", " ").title(),
+    )
+    for platform in SOCIAL_PLATFORMS
+)
+
+# SocialKey -> SOCIAL_URLS attribute, so known keys skip normalization on every render
+_SOCIAL_URL_ATTRS: dict[str, str] = {key: key.replace("-", "_") for key in get_args(SocialKey)}
+
 
 @register.simple_tag
 def social_url(key: SocialKey) -> str:
@@ -22,9 +36,8 @@ def social_url(key: SocialKey) -> str:
         The configured URL for the platform, or empty string if not configured
     """
     try:
-        social_platform = key.lower().replace("-", "_")
-        social_urls_conf = SOCIAL_URLS
-        return getattr(social_urls_conf, social_platform, "")
+        social_platform = _SOCIAL_URL_ATTRS.get(key) or key.lower().replace("-", "_")
+        return getattr(SOCIAL_URLS, social_platform, "")
     except (AttributeError, KeyError):
         return ""
 
@@ -61,21 +74,11 @@ def social_links(css_class: str = "", icon_size: str = "") -> dict[str, Any]:
     """
     links: list[dict[str, str]] = []
 
-    for platform in SOCIAL_PLATFORMS:
-        platform_key = platform.replace("-", "_")
-        social_urls_conf = SOCIAL_URLS
-
-        url = getattr(social_urls_conf, platform_key, None)
+    for platform, platform_key, icon, label in _SOCIAL_PLATFORM_META:
+        url = getattr(SOCIAL_URLS, platform_key, None)
 
         if url:
-            links.append(
-                {
-                    "platform": platform,
-                    "url": url,
-                    "icon": SOCIAL_PLATFORM_ICONS_MAP[platform],
-                    "label": platform.replace("-", " ").title(),
-                }
-            )
+            links.append({"platform": platform, "url": url, "icon": icon, "label": label})
 
     return {"links": links, "css_class": css_class, "icon_size": icon_size}
 
@@ -90,10 +93,7 @@ def has_social_urls(obj: Any = None) -> bool:
     Returns:
         True if at least one social URL is configured
     """
-    for platform in SOCIAL_PLATFORMS:
-        platform_key = platform.replace("-", "_")
-        social_urls_conf = SOCIAL_URLS
-
-        if getattr(social_urls_conf, platform_key, None):
+    for _, platform_key, _, _ in _SOCIAL_PLATFORM_META:
+        if getattr(SOCIAL_URLS, platform_key, None):
             return True
     return False
@@ -0,0 +1,266 @@
+"""Tests for the run command helpers: grouping and concurrent execution."""
+
+from io import StringIO
+from subprocess import CompletedProcess
+from threading import Event
+from typing import Any
+from unittest import TestCase, mock
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from djangx.cli.management.helpers import run as run_helpers
+from djangx.cli.management.helpers.run import (
+    CommandExecutor,
+    CommandOutput,
+    CommandProcess,
+    CommandResult,
+)
+
+
+class RecordingStdout:
+    """Stand-in for a command's stdout that records writes into a shared event log."""
+
+    def __init__(self, events: list[tuple[Any, ...]]) -> None:
+        self.events = events
+
+    def write(self, msg: str = "", style_func: Any = None, ending: str | None = None) -> None:
+        self.events.append(("write", msg))
+
+
+class RecordingOutput(CommandOutput):
+    """Output handler that records calls instead of printing them."""
+
+    def __init__(self, command: BaseCommand, events: list[tuple[Any, ...]]) -> None:
+        super().__init__(command)
+        self.events = events
+
+    def print_header(self, command_count: int, dry_run: bool, mode: str) -> None:
+        self.events.append(("header", command_count, dry_run, mode))
+
+    def print_no_commands_error(self, mode: str) -> None:
+        self.events.append(("no_commands", mode))
+
+    def print_dry_run_preview(self, commands: list[str]) -> None:
+        self.events.append(("preview", commands))
+
+    def print_command_header(self) -> None:
+        self.events.append(("command_header",))
+
+    def print_command_success(self, cmd: str, index: int, total: int) -> None:
+        self.events.append(("success", cmd, index, total))
+
+    def print_command_failure(self, cmd: str, error: str, index: int, total: int) -> None:
+        self.events.append(("failure", cmd, error, index, total))
+
+    def print_summary(self, total: int, completed: int, failed: int) -> None:
+        self.events.append(("summary", total, completed, failed))
+
+
+class FakeExecutor(CommandExecutor):
+    """Executor returning canned results, recording which path ran each command."""
+
+    def __init__(
+        self,
+        command: BaseCommand,
+        failures: dict[str, str] | None = None,
+        waits: dict[str, Event] | None = None,
+        done: dict[str, Event] | None = None,
+    ) -> None:
+        super().__init__(command)
+        self.failures = failures or {}
+        self.waits = waits or {}
+        self.done = done or {}
+        self.calls: list[tuple[str, str]] = []
+
+    def _result(self, cmd: str, output: str = "") -> CommandResult:
+        if cmd in self.failures:
+            return CommandResult(command=cmd, success=False, error=self.failures[cmd], output=output)
+        return CommandResult(command=cmd, success=True, output=output)
+
+    def execute(self, cmd: str) -> CommandResult:
+        self.calls.append(("inline", cmd))
+        return self._result(cmd)
+
+    def execute_in_subprocess(self, cmd: str) -> CommandResult:
+        self.calls.append(("subprocess", cmd))
+        if cmd in self.waits:
+            self.waits[cmd].wait(timeout=5)
+        result = self._result(cmd, output=f"output of {cmd}\n")
+        if cmd in self.done:
+            self.done[cmd].set()
+        return result
+
+
+class PartialLineCommand(BaseCommand):
+    """Command that finishes a line in two writes, like migrate's progress output."""
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.stdout.write("  Applying contenttypes.0001_initial...", ending="")
+        self.stdout.write(" OK")
+
+
+class ExecuteTests(TestCase):
+    def test_partial_line_writes_are_not_split(self) -> None:
+        stdout = StringIO()
+        executor = CommandExecutor(BaseCommand(stdout=stdout))
+
+        # Resolve the command name to the test command, keeping call_command's own handling
+        def call_partial_line_command(name: str, *args: Any, **options: Any) -> None:
+            call_command(PartialLineCommand(), *args, **options)
+
+        with mock.patch.object(run_helpers, "call_command", call_partial_line_command):
+            result = executor.execute("migrate")
+
+        self.assertTrue(result.success)
+        self.assertEqual(stdout.getvalue(), "  Applying contenttypes.0001_initial... OK\n")
+
+
+class CommandProcessTests(TestCase):
+    def setUp(self) -> None:
+        self.events: list[tuple[Any, ...]] = []
+        self.command = BaseCommand()
+        self.command.stdout = RecordingStdout(self.events)  # type: ignore[assignment]
+        self.output = RecordingOutput(self.command, self.events)
+
+        # Give every group enough workers, whatever the machine's CPU count
+        patcher = mock.patch.object(run_helpers, "cpu_count", return_value=4)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_process(self, executor: CommandExecutor, parallel: list[str]) -> CommandProcess:
+        return CommandProcess(self.command, self.output, executor, "BUILD", parallel=parallel)
+
+    def test_groups_consecutive_parallel_commands(self) -> None:
+        process = self.make_process(FakeExecutor(self.command), ["collectstatic", "compress"])
+
+        groups = list(
+            process._group_commands(
+                [
+                    "makemigrations",
+                    "collectstatic --noinput",
+                    "compress",
+                    "migrate",
+                    "collectstatic --clear",
+                ]
+            )
+        )
+
+        self.assertEqual(
+            groups,
+            [
+                ["makemigrations"],
+                ["collectstatic --noinput", "compress"],
+                ["migrate"],
+                ["collectstatic --clear"],
+            ],
+        )
+
+    def test_commands_run_inline_and_in_order_without_parallel_names(self) -> None:
+        executor = FakeExecutor(self.command)
+        process = self.make_process(executor, [])
+
+        process.run(["makemigrations", "migrate", "collectstatic --noinput"])
+
+        self.assertEqual(
+            executor.calls,
+            [
+                ("inline", "makemigrations"),
+                ("inline", "migrate"),
+                ("inline", "collectstatic --noinput"),
+            ],
+        )
+        self.assertEqual(self.events[-1], ("summary", 3, 3, 0))
+
+    def test_failing_command_in_parallel_group_is_reported_and_later_commands_run(self) -> None:
+        executor = FakeExecutor(self.command, failures={"compress": "CommandError: boom"})
+        process = self.make_process(executor, ["collectstatic", "compress"])
+
+        process.run(["makemigrations", "collectstatic --noinput", "compress", "migrate"])
+
+        failures = [event for event in self.events if event[0] == "failure"]
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(failures[0][1:3], ("compress", "CommandError: boom"))
+
+        # The sequential command after the group still runs, after the whole group
+        self.assertEqual(executor.calls[-1], ("inline", "migrate"))
+        self.assertEqual(
+            {cmd for path, cmd in executor.calls if path == "subprocess"},
+            {"collectstatic --noinput", "compress"},
+        )
+        self.assertEqual(self.events[-1], ("summary", 4, 3, 1))
+
+    def test_parallel_output_is_written_whole_per_command_in_completion_order(self) -> None:
+        # "collectstatic" waits until "compress" has finished, so "compress" completes first
+        compress_done = Event()
+        executor = FakeExecutor(
+            self.command,
+            waits={"collectstatic": compress_done},
+            done={"compress": compress_done},
+        )
+        process = self.make_process(executor, ["collectstatic", "compress"])
+
+        process.run(["collectstatic", "compress"])
+
+        command_events = [event for event in self.events if event[0] != "header"][:-1]
+        self.assertEqual(
+            command_events,
+            [
+                ("command_header",),
+                ("write", "output of compress\n"),
+                ("success", "compress", 1, 2),
+                ("command_header",),
+                ("write", "output of collectstatic\n"),
+                ("success", "collectstatic", 2, 2),
+            ],
+        )
+
+
+class ExecuteInSubprocessTests(TestCase):
+    def setUp(self) -> None:
+        self.executor = CommandExecutor(BaseCommand())
+
+    def test_success_captures_output(self) -> None:
+        completed = CompletedProcess(args=[], returncode=0, stdout="done\n", stderr="")
+        with mock.patch.object(run_helpers, "run", return_value=completed) as run_mock:
+            result = self.executor.execute_in_subprocess("collectstatic --noinput")
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.output, "done\n")
+        args, kwargs = run_mock.call_args
+        self.assertEqual(args[0][1:], ["-m", "djangx.cli.manage", "collectstatic", "--noinput"])
+        self.assertIs(kwargs["check"], False)
+
+    def test_failure_reports_last_stderr_line(self) -> None:
+        completed = CompletedProcess(
+            args=[], returncode=1, stdout="partial\n", stderr="Traceback\nCommandError: boom\n"
+        )
+        with mock.patch.object(run_helpers, "run", return_value=completed):
+            result = self.executor.execute_in_subprocess("compress")
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error, "CommandError: boom")
+        self.assertEqual(result.output, "partial\nTraceback\nCommandError: boom\n")
+
+    def test_failure_without_stderr_reports_exit_code(self) -> None:
+        completed = CompletedProcess(args=[], returncode=2, stdout="", stderr="")
+        with mock.patch.object(run_helpers, "run", return_value=completed):
+            result = self.executor.execute_in_subprocess("compress")
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error, "Exited with code 2")
+
+    def test_empty_command_is_rejected_without_spawning(self) -> None:
+        with mock.patch.object(run_helpers, "run") as run_mock:
+            result = self.executor.execute_in_subprocess("   ")
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error, "Empty command string")
+        run_mock.assert_not_called()
+
+    def test_oserror_is_reported(self) -> None:
+        with mock.patch.object(run_helpers, "run", side_effect=OSError("no python")):
+            result = self.executor.execute_in_subprocess("compress")
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error, "no python")